@@ -1,8 +1,13 @@
 """FastAPI dependencies for API endpoints."""
 
-import re
-from fastapi import Header
+import uuid
+from fastapi import Depends, Header
 from api.errors import APIError
+from api.storage_helpers import session_storage
+from core.session import DPDASession, DPDABuilder
+
+# Accepted session ID lengths: bare 32-digit hex or hyphenated 8-4-4-4-12
+SESSION_ID_LENGTHS = (32, 36)
 
 
 def get_session_id(x_session_id: str = Header(..., description="Session identifier for DPDA isolation")) -> str:
@@ -29,24 +34,86 @@ def get_session_id(x_session_id: str = Header(..., description="Session identifi
     if not x_session_id or x_session_id.strip() == "":
         raise APIError.bad_request(APIError.INVALID_SESSION_ID_EMPTY)
 
+    # Cheap length bound before any parsing work
+    if len(x_session_id) > 100:  # Reasonable max length
+        raise APIError.bad_request(APIError.INVALID_SESSION_ID_LENGTH)
+
     # Validate UUID format (with or without hyphens)
     # UUIDv4 format: 8-4-4-4-12 hex digits
-    uuid_pattern_with_hyphens = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-    uuid_pattern_without_hyphens = r'^[0-9a-f]{32}$'
+    if len(x_session_id) not in SESSION_ID_LENGTHS:
+        raise APIError.bad_request(APIError.INVALID_SESSION_ID_FORMAT)
 
-    session_id_lower = x_session_id.lower()
+    hex_digits = x_session_id
+    if len(x_session_id) == 36:
+        if not (x_session_id[8] == x_session_id[13] == x_session_id[18] == x_session_id[23] == '-'):
+            raise APIError.bad_request(APIError.INVALID_SESSION_ID_FORMAT)
+        hex_digits = x_session_id.replace('-', '')
 
-    if not (re.match(uuid_pattern_with_hyphens, session_id_lower) or
-            re.match(uuid_pattern_without_hyphens, session_id_lower)):
+    # uuid.UUID is case-insensitive but tolerates signs, underscores and
+    # whitespace via int(); restrict to ASCII alphanumerics first
+    if not (hex_digits.isascii() and hex_digits.isalnum()):
         raise APIError.bad_request(APIError.INVALID_SESSION_ID_FORMAT)
 
-    # Additional security checks
-    if len(x_session_id) > 100:  # Reasonable max length
-        raise APIError.bad_request(APIError.INVALID_SESSION_ID_LENGTH)
+    try:
+        uuid.UUID(hex_digits)
+    except ValueError:
+        raise APIError.bad_request(APIError.INVALID_SESSION_ID_FORMAT)
 
     return x_session_id
 
 
+async def get_session_dep(dpda_id: str, session_id: str = Depends(get_session_id)) -> DPDASession:
+    """
+    FastAPI dependency that loads the DPDA session named in the path.
+
+    Declared async so the dependency itself isn't dispatched to the
+    threadpool; the storage lookup only leaves the event loop when the
+    backend does blocking I/O (see SessionStorage.aget_session).
+
+    Args:
+        dpda_id: DPDA identifier from the request path
+        session_id: Validated session identifier
+
+    Returns:
+        DPDASession for the DPDA
+
+    Raises:
+        HTTPException: 404 if the DPDA does not exist in this session
+
+    Usage:
+        @app.get("/api/dpda/{dpda_id}")
+        async def get_dpda_info(dpda_id: str, session: DPDASession = Depends(get_session_dep)):
+            pass
+    """
+    session = await session_storage.aget_session(dpda_id, session_id)
+    if session is None:
+        raise APIError.not_found("DPDA")
+    return session
+
+
+async def get_builder_dep(dpda_id: str, session_id: str = Depends(get_session_id)) -> DPDABuilder:
+    """
+    FastAPI dependency that loads only the builder of the DPDA named in the path.
+
+    For read-only endpoints that inspect the DPDA's contents and don't need
+    a DPDASession.
+
+    Args:
+        dpda_id: DPDA identifier from the request path
+        session_id: Validated session identifier
+
+    Returns:
+        DPDABuilder for the DPDA
+
+    Raises:
+        HTTPException: 404 if the DPDA does not exist in this session
+    """
+    builder = await session_storage.aget_builder(dpda_id, session_id)
+    if builder is None:
+        raise APIError.not_found("DPDA")
+    return builder
+
+
 def get_session_id_optional(x_session_id: str = Header(None, description="Optional session identifier")) -> str | None:
     """
     Optional session ID dependency for endpoints that don't require authentication.
@@ -1,9 +1,15 @@
 """FastAPI endpoints for DPDA REST API."""
 
-from fastapi import FastAPI, Query, Depends
+from fastapi import FastAPI, Query, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Dict, List, Optional, Any
-import uuid
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from typing import Dict, List, Optional, Any, Tuple
+import hashlib
+import secrets
+from contextlib import asynccontextmanager
+from functools import lru_cache
+
+import orjson
 
 from api.models import (
     CreateDPDARequest, CreateDPDAResponse,
@@ -12,15 +18,15 @@ from api.models import (
     ValidationResponse, DPDAInfoResponse,
     ExportResponse, VisualizationResponse,
     ErrorResponse, ListDPDAsResponse,
-    DeleteTransitionResponse, TransitionsResponse, TransitionItem,
+    DeleteTransitionResponse, TransitionsResponse,
     UpdateDPDARequest, UpdateDPDAResponse,
     UpdateStatesRequest, UpdateAlphabetsRequest,
     UpdateTransitionRequest, UpdateTransitionResponse
 )
-from api.dependencies import get_session_id
+from api.dependencies import get_session_id, get_session_dep, get_builder_dep
 from api.errors import APIError
 from api.storage_helpers import session_storage
-from core.session import DPDASession, SessionError
+from core.session import DPDASession, DPDABuilder, SessionError, definition_from_snapshot
 from core.dpda_engine import DPDAEngine
 from validation.dpda_validator import DPDAValidator
 from serialization.dpda_serializer import DPDASerializer
@@ -29,11 +35,117 @@ from models.transition import Transition
 from models.configuration import Configuration
 
 
+# Engine, validator, serializer and graph builder hold no state, so one
+# instance of each is shared across requests
+_engine = DPDAEngine()
+_validator = DPDAValidator()
+_serializer = DPDASerializer()
+_graph_builder = GraphBuilder()
+
+# Visualization format -> graph builder method
+_VISUALIZERS = {
+    "dot": _graph_builder.to_dot,
+    "d3": _graph_builder.to_d3,
+    "cytoscape": _graph_builder.to_cytoscape,
+}
+
+
+# Exports and visualizations are pure functions of the DPDA contents, so
+# they are memoized on the builder snapshot; any edit changes the key.
+# Cached values are shared between requests and must not be mutated.
+@lru_cache(maxsize=512)
+def _export_cached(snapshot: Tuple, format: str) -> Dict[str, Any]:
+    """Serialize the DPDA described by a builder snapshot."""
+    return _serializer.to_dict(definition_from_snapshot(snapshot))
+
+
+@lru_cache(maxsize=512)
+def _visualize_cached(snapshot: Tuple, format: str) -> Any:
+    """Render the DPDA described by a builder snapshot in a visualization format."""
+    return _VISUALIZERS[format](definition_from_snapshot(snapshot))
+
+
+def _orjson_default(value: Any) -> Any:
+    """Serialize the frozensets in a builder snapshot as sorted lists."""
+    if isinstance(value, frozenset):
+        return sorted(value)
+    raise TypeError
+
+
+@lru_cache(maxsize=512)
+def _snapshot_etag(snapshot: Tuple, *parts: str) -> str:
+    """
+    Compute a stable ETag for a response determined by a snapshot and ``parts``.
+
+    The tag is a BLAKE2b digest of the canonical JSON encoding, so it is the
+    same in every worker process and across restarts.
+    """
+    payload = orjson.dumps([snapshot, *parts], default=_orjson_default)
+    return f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+
+
+def _conditional_get(request: Request, response: Response, snapshot: Tuple, *parts: str) -> Optional[Response]:
+    """
+    Handle If-None-Match for a GET whose body is determined by ``snapshot`` and ``parts``.
+
+    Args:
+        request: Incoming request
+        response: Response whose headers receive the ETag
+        snapshot: DPDABuilder.snapshot_key() of the DPDA being read
+        *parts: Other strings the response body depends on
+
+    Returns:
+        A 304 response if the client's copy is current, otherwise None
+    """
+    etag = _snapshot_etag(snapshot, *parts)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # Weak comparison, as RFC 9110 requires for If-None-Match
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return None
+
+
+def _warmup() -> None:
+    """
+    Run a tiny DPDA through the engine, validator, serializer and graph
+    builder so the first real request doesn't pay for cold code paths.
+    """
+    session = DPDASession("warmup")
+    session.new_dpda("warmup")
+    session.set_states({"q0"})
+    session.set_input_alphabet({"a"})
+    session.set_stack_alphabet({"Z"})
+    session.set_initial_state("q0")
+    session.set_initial_stack_symbol("Z")
+    session.add_transition("q0", "a", "Z", "q0", ["Z"])
+    dpda = session.build_current_dpda()
+
+    _engine.compute(dpda, "a", 10)
+    _validator.validate(dpda)
+    _serializer.to_dict(dpda)
+    for visualize in _VISUALIZERS.values():
+        visualize(dpda)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan: warm up hot paths before serving traffic."""
+    _warmup()
+    yield
+
+
 # Create FastAPI app
 app = FastAPI(
     title="DPDA Simulator API",
     description="REST API for Deterministic Pushdown Automaton simulation",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson serializes large responses (e.g. long computation traces)
+    # considerably faster than the stdlib json encoder
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -45,6 +157,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Health check payload never changes, so serialize it once
+_HEALTH_BYTES = b'{"status":"healthy","version":"1.0.0"}'
+
 # Note: Storage backend is now configured via STORAGE_BACKEND environment variable
 # - 'memory': In-memory storage (fast, non-persistent)
 # - 'database': SQLite storage (persistent across restarts)
@@ -53,157 +168,126 @@ app.add_middleware(
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy", "version": "1.0.0"}
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
-@app.post("/api/dpda/create", response_model=CreateDPDAResponse)
+@app.post("/api/dpda/create", response_model=None, responses={200: {"model": CreateDPDAResponse}})
 async def create_dpda(request: CreateDPDARequest, session_id: str = Depends(get_session_id)):
     """Create a new DPDA."""
     # Generate unique DPDA ID
-    dpda_id = f"dpda_{uuid.uuid4().hex[:8]}"
+    dpda_id = f"dpda_{secrets.token_hex(4)}"
 
     try:
         # Create session and store it
-        session_storage.create_session(dpda_id, session_id, request.name)
+        await session_storage.acreate_session(dpda_id, session_id, request.name)
 
-        return CreateDPDAResponse(
-            id=dpda_id,
-            name=request.name,
-            created=True,
-            message="DPDA created successfully"
-        )
+        return {
+            "id": dpda_id,
+            "name": request.name,
+            "created": True,
+            "message": "DPDA created successfully"
+        }
     except SessionError as e:
         raise APIError.bad_request(str(e))
 
 
-@app.get("/api/dpda/list", response_model=ListDPDAsResponse)
+# Hot read endpoints below return plain dicts already shaped like their
+# response models. ``response_model=None`` skips FastAPI's outbound
+# validation pass; ``responses`` keeps the schema in the OpenAPI docs.
+@app.get("/api/dpda/list", response_model=None, responses={200: {"model": ListDPDAsResponse}})
 async def list_dpdas(session_id: str = Depends(get_session_id)):
     """List all DPDAs for the current session."""
-    # Get all DPDAs for this session from storage
-    dpdas = session_storage.list_sessions(session_id)
+    # Load every DPDA for this session (metadata and builder) in one pass
     dpda_list = []
 
-    for dpda_info in dpdas:
-        dpda_id = dpda_info['id']
-
-        # Get session to check validity
-        session = session_storage.get_session(dpda_id, session_id)
-        is_valid = False
-
-        if session:
-            builder = session.get_current_builder()
-            # Check validity if possible
-            try:
-                if builder.states and builder.initial_state:
-                    dpda = session.build_current_dpda()
-                    validator = DPDAValidator()
-                    result = validator.validate(dpda)
-                    is_valid = result.is_valid
-            except:
-                pass
-
+    for dpda_info, session in await session_storage.alist_sessions_full(session_id):
         dpda_list.append({
-            "id": dpda_id,
+            "id": dpda_info['id'],
             "name": dpda_info.get('name', 'unnamed'),
-            "is_valid": is_valid
+            "is_valid": session.try_build_and_validate()[0]
         })
 
-    return ListDPDAsResponse(dpdas=dpda_list, count=len(dpda_list))
+    return {"dpdas": dpda_list, "count": len(dpda_list)}
 
 
-@app.get("/api/dpda/{dpda_id}", response_model=DPDAInfoResponse)
-async def get_dpda_info(dpda_id: str, session_id: str = Depends(get_session_id)):
+@app.get("/api/dpda/{dpda_id}", response_model=None, responses={200: {"model": DPDAInfoResponse}})
+async def get_dpda_info(dpda_id: str, request: Request, response: Response, session: DPDASession = Depends(get_session_dep)):
     """Get information about a DPDA."""
-    session = session_storage.get_session(dpda_id, session_id)
-    if not session:
-        raise APIError.not_found("DPDA")
-
     builder = session.get_current_builder()
 
-    # Check if DPDA can be built
-    is_complete = all([
-        builder.states,
-        builder.initial_state,
-        builder.stack_alphabet,
-        builder.initial_stack_symbol
-    ])
-
-    # Validate if complete
-    is_valid = False
-    if is_complete:
-        try:
-            dpda = session.build_current_dpda()
-            validator = DPDAValidator()
-            result = validator.validate(dpda)
-            is_valid = result.is_valid
-        except:
-            pass
-
-    return DPDAInfoResponse(
-        id=dpda_id,
-        name=session.current_dpda_name or "unnamed",
-        states=list(builder.states),
-        input_alphabet=list(builder.input_alphabet),
-        stack_alphabet=list(builder.stack_alphabet),
-        initial_state=builder.initial_state or "",
-        initial_stack_symbol=builder.initial_stack_symbol or "",
-        accept_states=list(builder.accept_states),
-        num_transitions=len(builder.transitions),
-        is_complete=is_complete,
-        is_valid=is_valid
-    )
+    not_modified = _conditional_get(request, response, builder.snapshot_key(), dpda_id, session.current_dpda_name)
+    if not_modified is not None:
+        return not_modified
 
+    # Check if DPDA can be built; the chained 'and' stops at the first gap
+    is_complete = bool(
+        builder.states
+        and builder.initial_state
+        and builder.stack_alphabet
+        and builder.initial_stack_symbol
+    )
 
-@app.get("/api/dpda/{dpda_id}/transitions", response_model=TransitionsResponse)
-async def get_transitions(dpda_id: str, session_id: str = Depends(get_session_id)):
+    # Validate if complete; unchanged DPDAs hit the snapshot-keyed memo
+    is_valid = is_complete and session.try_build_and_validate()[0]
+
+    # orjson doesn't serialize sets, so the builder sets become lists here
+    return {
+        "id": dpda_id,
+        "name": session.current_dpda_name or "unnamed",
+        "states": list(builder.states),
+        "input_alphabet": list(builder.input_alphabet),
+        "stack_alphabet": list(builder.stack_alphabet),
+        "initial_state": builder.initial_state or "",
+        "initial_stack_symbol": builder.initial_stack_symbol or "",
+        "accept_states": list(builder.accept_states),
+        "num_transitions": len(builder.transitions),
+        "is_complete": is_complete,
+        "is_valid": is_valid
+    }
+
+
+@app.get("/api/dpda/{dpda_id}/transitions", response_model=None, responses={200: {"model": TransitionsResponse}})
+async def get_transitions(dpda_id: str, request: Request, response: Response, builder: DPDABuilder = Depends(get_builder_dep)):
     """Get all transitions for a DPDA."""
-    session = session_storage.get_session(dpda_id, session_id)
-    if not session:
-        raise APIError.not_found("DPDA")
-    builder = session.get_current_builder()
-
-    # Convert transitions to API format
-    transition_items = []
-    for trans in builder.transitions:
-        # Convert stack_push string to array
-        if trans.stack_push:
-            stack_push_array = trans.stack_push.split(',')
-        else:
-            stack_push_array = []
-
-        transition_items.append(TransitionItem(
-            from_state=trans.from_state,
-            input_symbol=trans.input_symbol,
-            stack_top=trans.stack_top,
-            to_state=trans.to_state,
-            stack_push=stack_push_array
-        ))
-
-    return TransitionsResponse(
-        transitions=transition_items,
-        total=len(transition_items)
+    not_modified = _conditional_get(request, response, builder.snapshot_key())
+    if not_modified is not None:
+        return not_modified
+
+    # Convert transitions to API format (TransitionItem shape)
+    transition_items = [
+        {
+            "from_state": trans.from_state,
+            "input_symbol": trans.input_symbol,
+            "stack_top": trans.stack_top,
+            "to_state": trans.to_state,
+            "stack_push": list(trans.push_symbols)
+        }
+        for trans in builder.transitions
+    ]
+
+    # Encoded straight to JSON, skipping jsonable_encoder's walk over every
+    # transition; the ETag set on ``response`` is passed along explicitly
+    return ORJSONResponse(
+        {"transitions": transition_items, "total": len(transition_items)},
+        headers=response.headers
     )
 
 
 @app.post("/api/dpda/{dpda_id}/states")
-async def set_states(dpda_id: str, request: SetStatesRequest, session_id: str = Depends(get_session_id)):
+async def set_states(dpda_id: str, request: SetStatesRequest, session: DPDASession = Depends(get_session_dep), session_id: str = Depends(get_session_id)):
     """Set DPDA states."""
-    session = session_storage.get_session(dpda_id, session_id)
-    if not session:
-        raise APIError.not_found("DPDA")
-
     try:
-        # Set states directly as strings
-        session.set_states(set(request.states))
+        # Session setters build their own (interned) sets from the lists
+        session.set_states(request.states)
 
         # Set initial state
         session.set_initial_state(request.initial_state)
 
         # Set accept states
-        session.set_accept_states(set(request.accept_states))
+        session.set_accept_states(request.accept_states)
 
         # Save updated session to storage
-        session_storage.update_session(dpda_id, session_id, session)
+        await session_storage.aupdate_session(dpda_id, session_id, session)
 
         return {"success": True, "message": "States configured successfully"}
     except (SessionError, ValueError) as e:
@@ -211,19 +295,15 @@ async def set_states(dpda_id: str, request: SetStatesRequest, session_id: str =
 
 
 @app.post("/api/dpda/{dpda_id}/alphabets")
-async def set_alphabets(dpda_id: str, request: SetAlphabetsRequest, session_id: str = Depends(get_session_id)):
+async def set_alphabets(dpda_id: str, request: SetAlphabetsRequest, session: DPDASession = Depends(get_session_dep), session_id: str = Depends(get_session_id)):
     """Set DPDA alphabets."""
-    session = session_storage.get_session(dpda_id, session_id)
-    if not session:
-        raise APIError.not_found("DPDA")
-
     try:
-        session.set_input_alphabet(set(request.input_alphabet))
-        session.set_stack_alphabet(set(request.stack_alphabet))
+        session.set_input_alphabet(request.input_alphabet)
+        session.set_stack_alphabet(request.stack_alphabet)
         session.set_initial_stack_symbol(request.initial_stack_symbol)
 
         # Save updated session to storage
-        session_storage.update_session(dpda_id, session_id, session)
+        await session_storage.aupdate_session(dpda_id, session_id, session)
 
         return {"success": True, "message": "Alphabets configured successfully"}
     except SessionError as e:
@@ -231,173 +311,194 @@ async def set_alphabets(dpda_id: str, request: SetAlphabetsRequest, session_id:
 
 
 @app.post("/api/dpda/{dpda_id}/transition")
-async def add_transition(dpda_id: str, request: AddTransitionRequest, session_id: str = Depends(get_session_id)):
+async def add_transition(dpda_id: str, request: AddTransitionRequest, session: DPDASession = Depends(get_session_dep), session_id: str = Depends(get_session_id)):
     """Add a transition to the DPDA."""
-    session = session_storage.get_session(dpda_id, session_id)
-    if not session:
-        raise APIError.not_found("DPDA")
-
     try:
-        # Handle stack push
-        if request.stack_push:
-            stack_push = ",".join(request.stack_push)
-        else:
-            stack_push = ""  # Empty string for no push, not None
-
         session.add_transition(
             from_state=request.from_state,
             input_symbol=request.input_symbol,
             stack_top=request.stack_top,
             to_state=request.to_state,
-            stack_push=stack_push
+            stack_push=request.stack_push
         )
 
         # Save updated session to storage
-        session_storage.update_session(dpda_id, session_id, session)
+        await session_storage.aupdate_session(dpda_id, session_id, session)
 
         return {"added": True, "message": "Transition added successfully"}
     except (SessionError, ValueError, IndexError) as e:
         raise APIError.bad_request(str(e))
 
 
-@app.delete("/api/dpda/{dpda_id}/transition/{index}", response_model=DeleteTransitionResponse)
-async def delete_transition(dpda_id: str, index: int, session_id: str = Depends(get_session_id)):
+@app.delete("/api/dpda/{dpda_id}/transition/{index}", response_model=None, responses={200: {"model": DeleteTransitionResponse}})
+async def delete_transition(dpda_id: str, index: int, session: DPDASession = Depends(get_session_dep), session_id: str = Depends(get_session_id)):
     """Delete a transition from the DPDA."""
-    session = session_storage.get_session(dpda_id, session_id)
-    if not session:
-        raise APIError.not_found("DPDA")
-
     try:
         session.remove_transition(index)
 
         # Save updated session to storage
-        session_storage.update_session(dpda_id, session_id, session)
+        await session_storage.aupdate_session(dpda_id, session_id, session)
 
-        return DeleteTransitionResponse(
-            deleted=True,
-            message="Transition removed successfully",
-            remaining_transitions=len(session.get_current_builder().transitions)
-        )
+        return {
+            "deleted": True,
+            "message": "Transition removed successfully",
+            "remaining_transitions": len(session.get_current_builder().transitions)
+        }
     except (SessionError, IndexError) as e:
         raise APIError.not_found("Transition")
 
 
-@app.post("/api/dpda/{dpda_id}/compute", response_model=ComputeResponse)
-async def compute_string(dpda_id: str, request: ComputeRequest, session_id: str = Depends(get_session_id)):
-    """Compute whether a string is accepted by the DPDA."""
-    session = session_storage.get_session(dpda_id, session_id)
-    if not session:
-        raise APIError.not_found("DPDA")
+# Trace configurations per chunk written to a streamed compute response
+TRACE_STREAM_BATCH = 256
+
+
+async def _iter_compute_ndjson(result, final_stack: List[str]):
+    """
+    Yield a computation result as newline-delimited JSON.
+
+    The first line carries the ComputeResponse fields other than the trace;
+    each following line is one trace configuration. An async generator is
+    used because Starlette iterates sync generators in the threadpool, one
+    hop per chunk; trace lines are also batched into chunks of
+    TRACE_STREAM_BATCH so a long trace isn't sent one line per write.
+    """
+    yield orjson.dumps({
+        "accepted": result.accepted,
+        "final_state": result.final_state,
+        "final_stack": final_stack,
+        "steps_taken": result.steps_taken,
+        "reason": result.rejection_reason
+    }) + b"\n"
+
+    trace = result.trace
+    for start in range(0, len(trace), TRACE_STREAM_BATCH):
+        yield b"".join(
+            orjson.dumps(
+                {"state": c.state, "input": c.remaining_input, "stack": c.stack}
+            ) + b"\n"
+            for c in trace[start:start + TRACE_STREAM_BATCH]
+        )
 
+
+# Omit unset optional fields (trace without show_trace, reason on acceptance)
+# so they are neither validated nor encoded
+@app.post("/api/dpda/{dpda_id}/compute", response_model=None, responses={200: {"model": ComputeResponse}})
+async def compute_string(
+    dpda_id: str,
+    request: ComputeRequest,
+    stream: bool = Query(False, description="Stream the trace as NDJSON"),
+    session: DPDASession = Depends(get_session_dep)
+):
+    """
+    Compute whether a string is accepted by the DPDA.
+
+    With stream=true and show_trace set, the result is sent as NDJSON:
+    a summary line followed by one line per trace configuration, so long
+    traces are never encoded as a single JSON document.
+    """
     try:
         dpda = session.build_current_dpda()
-        engine = DPDAEngine()
-        result = engine.compute(dpda, request.input_string, request.max_steps)
+        # Only record every configuration when the trace will be returned
+        result = _engine.compute(
+            dpda, request.input_string, request.max_steps, keep_trace=request.show_trace
+        )
+        final_stack = result.final_stack
+
+        if stream and request.show_trace:
+            return StreamingResponse(
+                _iter_compute_ndjson(result, final_stack),
+                media_type="application/x-ndjson"
+            )
 
         # Format trace if requested
         trace = None
         if request.show_trace and result.trace:
-            trace = []
-            for config in result.trace:
-                trace.append({
-                    "state": config.state,
-                    "input": config.remaining_input,
-                    "stack": config.stack
-                })
-
-        # Get final stack from last configuration in trace
-        final_stack = []
-        if result.trace and len(result.trace) > 0:
-            final_stack = result.trace[-1].stack
-
-        return ComputeResponse(
-            accepted=result.accepted,
-            final_state=result.final_state,
-            final_stack=final_stack,
-            steps_taken=result.steps_taken,
-            trace=trace,
-            reason=result.rejection_reason
-        )
+            trace = [
+                {"state": c.state, "input": c.remaining_input, "stack": c.stack}
+                for c in result.trace
+            ]
+
+        # Encoded straight to JSON (ComputeResponse shape) so a long trace
+        # skips response-model validation and jsonable_encoder; None fields
+        # are omitted
+        body = {
+            "accepted": result.accepted,
+            "final_state": result.final_state,
+            "final_stack": final_stack,
+            "steps_taken": result.steps_taken
+        }
+        if trace is not None:
+            body["trace"] = trace
+        if result.rejection_reason is not None:
+            body["reason"] = result.rejection_reason
+        return ORJSONResponse(body)
     except SessionError as e:
         raise APIError.bad_request(str(e))
 
 
-@app.post("/api/dpda/{dpda_id}/validate", response_model=ValidationResponse)
-async def validate_dpda(dpda_id: str, session_id: str = Depends(get_session_id)):
+@app.post("/api/dpda/{dpda_id}/validate", response_model=None, responses={200: {"model": ValidationResponse}})
+async def validate_dpda(dpda_id: str, session: DPDASession = Depends(get_session_dep)):
     """Validate the DPDA for determinism properties."""
-    session = session_storage.get_session(dpda_id, session_id)
-    if not session:
-        raise APIError.not_found("DPDA")
-
     try:
         dpda = session.build_current_dpda()
-        validator = DPDAValidator()
-        result = validator.validate(dpda)
-
-        # Format violations
-        violations = []
-        for error in result.errors:
-            violations.append({
-                "type": error.split(":")[0] if ":" in error else "UNKNOWN",
-                "description": error
-            })
-
-        return ValidationResponse(
-            is_valid=result.is_valid,
-            violations=violations,
-            message="DPDA is deterministic" if result.is_valid else "DPDA violates determinism properties"
-        )
+        result = _validator.validate(dpda)
+
+        violations = [
+            {"type": v.type, "description": v.description}
+            for v in result.violations
+        ]
+
+        # Encoded straight to JSON, like compute, skipping response-model validation
+        return ORJSONResponse({
+            "is_valid": result.is_valid,
+            "violations": violations,
+            "message": "DPDA is deterministic" if result.is_valid else "DPDA violates determinism properties"
+        })
     except SessionError as e:
         raise APIError.bad_request(str(e))
 
 
-@app.get("/api/dpda/{dpda_id}/export", response_model=ExportResponse)
-async def export_dpda(dpda_id: str, format: str = Query("json", description="Export format"), session_id: str = Depends(get_session_id)):
+# Export and visualization payloads are arbitrarily nested dicts. Returning
+# an ORJSONResponse directly hands them to orjson without response-model
+# validation or jsonable_encoder first walking and copying the structure.
+# Returned responses don't pick up headers set on the injected ``response``
+# (the ETag), so those are passed along explicitly.
+@app.get("/api/dpda/{dpda_id}/export", response_model=None, responses={200: {"model": ExportResponse}})
+async def export_dpda(dpda_id: str, request: Request, response: Response, format: str = Query("json", description="Export format"), session: DPDASession = Depends(get_session_dep)):
     """Export the DPDA definition."""
-    session = session_storage.get_session(dpda_id, session_id)
-    if not session:
-        raise APIError.not_found("DPDA")
-
     try:
-        dpda = session.build_current_dpda()
-        serializer = DPDASerializer()
-
+        snapshot = session.current_snapshot_key()
         if format == "json":
-            data_dict = serializer.to_dict(dpda)
+            not_modified = _conditional_get(request, response, snapshot, format)
+            if not_modified is not None:
+                return not_modified
+            data_dict = _export_cached(snapshot, format)
             # Extract just the DPDA data for the response
-            return ExportResponse(
-                format="json",
-                data=data_dict['dpda'],
-                version=data_dict['version']
-            )
+            return ORJSONResponse({
+                "format": "json",
+                "data": data_dict['dpda'],
+                "version": data_dict['version']
+            }, headers=response.headers)
         else:
             raise APIError.unsupported_format("export", format)
     except SessionError as e:
         raise APIError.bad_request(str(e))
 
 
-@app.get("/api/dpda/{dpda_id}/visualize", response_model=VisualizationResponse)
-async def visualize_dpda(dpda_id: str, format: str = Query("dot", description="Visualization format"), session_id: str = Depends(get_session_id)):
+@app.get("/api/dpda/{dpda_id}/visualize", response_model=None, responses={200: {"model": VisualizationResponse}})
+async def visualize_dpda(dpda_id: str, request: Request, response: Response, format: str = Query("dot", description="Visualization format"), session: DPDASession = Depends(get_session_dep)):
     """Generate visualization data for the DPDA."""
-    session = session_storage.get_session(dpda_id, session_id)
-    if not session:
-        raise APIError.not_found("DPDA")
-
     try:
-        dpda = session.build_current_dpda()
-        graph_builder = GraphBuilder()
-
-        if format == "dot":
-            data = graph_builder.to_dot(dpda)
-            return VisualizationResponse(format="dot", data=data)
-        elif format == "d3":
-            data = graph_builder.to_d3(dpda)
-            return VisualizationResponse(format="d3", data=data)
-        elif format == "cytoscape":
-            data = graph_builder.to_cytoscape(dpda)
-            return VisualizationResponse(format="cytoscape", data=data)
-        else:
+        snapshot = session.current_snapshot_key()
+        if format not in _VISUALIZERS:
             raise APIError.unsupported_format("visualization", format)
+        not_modified = _conditional_get(request, response, snapshot, format)
+        if not_modified is not None:
+            return not_modified
+        return ORJSONResponse(
+            {"format": format, "data": _visualize_cached(snapshot, format)},
+            headers=response.headers
+        )
     except SessionError as e:
         raise APIError.bad_request(str(e))
 
@@ -405,20 +506,15 @@ async def visualize_dpda(dpda_id: str, format: str = Query("dot", description="V
 @app.delete("/api/dpda/{dpda_id}")
 async def delete_dpda(dpda_id: str, session_id: str = Depends(get_session_id)):
     """Delete a DPDA."""
-    if not session_storage.exists(dpda_id, session_id):
+    if not await session_storage.adelete_session(dpda_id, session_id):
         raise APIError.not_found("DPDA")
 
-    session_storage.delete_session(dpda_id, session_id)
     return {"deleted": True, "message": "DPDA deleted successfully"}
 
 
-@app.patch("/api/dpda/{dpda_id}", response_model=UpdateDPDAResponse)
-async def update_dpda_metadata(dpda_id: str, request: UpdateDPDARequest, session_id: str = Depends(get_session_id)):
+@app.patch("/api/dpda/{dpda_id}", response_model=None, responses={200: {"model": UpdateDPDAResponse}})
+async def update_dpda_metadata(dpda_id: str, request: UpdateDPDARequest, session: DPDASession = Depends(get_session_dep), session_id: str = Depends(get_session_id)):
     """Update DPDA metadata (name and description)."""
-    session = session_storage.get_session(dpda_id, session_id)
-    if not session:
-        raise APIError.not_found("DPDA")
-
     try:
         changes = session.update_metadata(
             name=request.name,
@@ -428,33 +524,29 @@ async def update_dpda_metadata(dpda_id: str, request: UpdateDPDARequest, session
         # Save updated session to storage
         # If name was changed, pass it to update the storage record
         new_name = request.name if 'name' in changes else None
-        session_storage.update_session(dpda_id, session_id, session, name=new_name)
+        await session_storage.aupdate_session(dpda_id, session_id, session, name=new_name)
 
-        return UpdateDPDAResponse(
-            id=dpda_id,
-            updated=True,
-            message="DPDA updated successfully",
-            changes=changes
-        )
+        return {
+            "id": dpda_id,
+            "updated": True,
+            "message": "DPDA updated successfully",
+            "changes": changes
+        }
     except SessionError as e:
         raise APIError.bad_request(str(e))
 
 
 @app.put("/api/dpda/{dpda_id}/states")
-async def update_states_full(dpda_id: str, request: SetStatesRequest, session_id: str = Depends(get_session_id)):
+async def update_states_full(dpda_id: str, request: SetStatesRequest, session: DPDASession = Depends(get_session_dep), session_id: str = Depends(get_session_id)):
     """Full replacement of states configuration (PUT)."""
-    session = session_storage.get_session(dpda_id, session_id)
-    if not session:
-        raise APIError.not_found("DPDA")
-
     try:
         # Full replacement - use existing set_states methods
-        session.set_states(set(request.states))
+        session.set_states(request.states)
         session.set_initial_state(request.initial_state)
-        session.set_accept_states(set(request.accept_states))
+        session.set_accept_states(request.accept_states)
 
         # Save updated session to storage
-        session_storage.update_session(dpda_id, session_id, session)
+        await session_storage.aupdate_session(dpda_id, session_id, session)
 
         return {"updated": True, "message": "States updated successfully"}
     except (SessionError, ValueError) as e:
@@ -462,21 +554,17 @@ async def update_states_full(dpda_id: str, request: SetStatesRequest, session_id
 
 
 @app.patch("/api/dpda/{dpda_id}/states")
-async def update_states_partial(dpda_id: str, request: UpdateStatesRequest, session_id: str = Depends(get_session_id)):
+async def update_states_partial(dpda_id: str, request: UpdateStatesRequest, session: DPDASession = Depends(get_session_dep), session_id: str = Depends(get_session_id)):
     """Partial update of states configuration (PATCH)."""
-    session = session_storage.get_session(dpda_id, session_id)
-    if not session:
-        raise APIError.not_found("DPDA")
-
     try:
         changes = session.update_states(
-            states=set(request.states) if request.states else None,
+            states=request.states or None,
             initial_state=request.initial_state,
-            accept_states=set(request.accept_states) if request.accept_states else None
+            accept_states=request.accept_states or None
         )
 
         # Save updated session to storage
-        session_storage.update_session(dpda_id, session_id, session)
+        await session_storage.aupdate_session(dpda_id, session_id, session)
 
         return {
             "updated": True,
@@ -488,19 +576,15 @@ async def update_states_partial(dpda_id: str, request: UpdateStatesRequest, sess
 
 
 @app.put("/api/dpda/{dpda_id}/alphabets")
-async def update_alphabets_full(dpda_id: str, request: SetAlphabetsRequest, session_id: str = Depends(get_session_id)):
+async def update_alphabets_full(dpda_id: str, request: SetAlphabetsRequest, session: DPDASession = Depends(get_session_dep), session_id: str = Depends(get_session_id)):
     """Full replacement of alphabets configuration (PUT)."""
-    session = session_storage.get_session(dpda_id, session_id)
-    if not session:
-        raise APIError.not_found("DPDA")
-
     try:
-        session.set_input_alphabet(set(request.input_alphabet))
-        session.set_stack_alphabet(set(request.stack_alphabet))
+        session.set_input_alphabet(request.input_alphabet)
+        session.set_stack_alphabet(request.stack_alphabet)
         session.set_initial_stack_symbol(request.initial_stack_symbol)
 
         # Save updated session to storage
-        session_storage.update_session(dpda_id, session_id, session)
+        await session_storage.aupdate_session(dpda_id, session_id, session)
 
         return {"updated": True, "message": "Alphabets updated successfully"}
     except SessionError as e:
@@ -508,21 +592,17 @@ async def update_alphabets_full(dpda_id: str, request: SetAlphabetsRequest, sess
 
 
 @app.patch("/api/dpda/{dpda_id}/alphabets")
-async def update_alphabets_partial(dpda_id: str, request: UpdateAlphabetsRequest, session_id: str = Depends(get_session_id)):
+async def update_alphabets_partial(dpda_id: str, request: UpdateAlphabetsRequest, session: DPDASession = Depends(get_session_dep), session_id: str = Depends(get_session_id)):
     """Partial update of alphabets configuration (PATCH)."""
-    session = session_storage.get_session(dpda_id, session_id)
-    if not session:
-        raise APIError.not_found("DPDA")
-
     try:
         changes = session.update_alphabets(
-            input_alphabet=set(request.input_alphabet) if request.input_alphabet else None,
-            stack_alphabet=set(request.stack_alphabet) if request.stack_alphabet else None,
+            input_alphabet=request.input_alphabet or None,
+            stack_alphabet=request.stack_alphabet or None,
             initial_stack_symbol=request.initial_stack_symbol
         )
 
         # Save updated session to storage
-        session_storage.update_session(dpda_id, session_id, session)
+        await session_storage.aupdate_session(dpda_id, session_id, session)
 
         return {
             "updated": True,
@@ -533,36 +613,27 @@ async def update_alphabets_partial(dpda_id: str, request: UpdateAlphabetsRequest
         raise APIError.bad_request(str(e))
 
 
-@app.put("/api/dpda/{dpda_id}/transition/{index}", response_model=UpdateTransitionResponse)
-async def update_transition(dpda_id: str, index: int, request: UpdateTransitionRequest, session_id: str = Depends(get_session_id)):
+@app.put("/api/dpda/{dpda_id}/transition/{index}", response_model=None, responses={200: {"model": UpdateTransitionResponse}})
+async def update_transition(dpda_id: str, index: int, request: UpdateTransitionRequest, session: DPDASession = Depends(get_session_dep), session_id: str = Depends(get_session_id)):
     """Update a specific transition by index (PUT)."""
-    session = session_storage.get_session(dpda_id, session_id)
-    if not session:
-        raise APIError.not_found("DPDA")
-
     try:
-        # Handle stack push conversion if provided
-        stack_push = None
-        if request.stack_push is not None:
-            stack_push = ",".join(request.stack_push) if request.stack_push else ""
-
         changes = session.update_transition(
             index=index,
             from_state=request.from_state,
             input_symbol=request.input_symbol,
             stack_top=request.stack_top,
             to_state=request.to_state,
-            stack_push=stack_push
+            stack_push=request.stack_push
         )
 
         # Save updated session to storage
-        session_storage.update_session(dpda_id, session_id, session)
+        await session_storage.aupdate_session(dpda_id, session_id, session)
 
-        return UpdateTransitionResponse(
-            updated=True,
-            message="Transition updated successfully",
-            changes=changes
-        )
+        return {
+            "updated": True,
+            "message": "Transition updated successfully",
+            "changes": changes
+        }
     except IndexError:
         raise APIError.not_found("Transition")
     except (SessionError, ValueError) as e:
@@ -1,8 +1,15 @@
 """Pydantic models for API request and response validation."""
 
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Literal, Optional, Dict, Any, Union
 from pydantic import BaseModel, Field, field_validator, model_validator
-from enum import Enum
+
+
+def _check_push_symbols(symbols: List[str]) -> List[str]:
+    """Reject push symbols that can't survive the comma-separated stack_push form."""
+    for symbol in symbols:
+        if not symbol or ',' in symbol:
+            raise ValueError(f"Invalid stack push symbol {symbol!r}: symbols must be non-empty and contain no ','")
+    return symbols
 
 
 class CreateDPDARequest(BaseModel):
@@ -36,10 +43,11 @@ class SetStatesRequest(BaseModel):
     @model_validator(mode='after')
     def validate_state_membership(self) -> 'SetStatesRequest':
         """Validate that initial and accept states are in states list."""
-        if self.initial_state not in self.states:
+        states = set(self.states)
+        if self.initial_state not in states:
             raise ValueError(f"Initial state '{self.initial_state}' must be in states list")
         for state in self.accept_states:
-            if state not in self.states:
+            if state not in states:
                 raise ValueError(f"Accept state '{state}' must be in states list")
         return self
 
@@ -66,6 +74,12 @@ class AddTransitionRequest(BaseModel):
     to_state: str = Field(..., description="Target state")
     stack_push: List[str] = Field(default_factory=list, description="Symbols to push onto stack")
 
+    @field_validator('stack_push')
+    @classmethod
+    def validate_push_symbols(cls, v: List[str]) -> List[str]:
+        """Ensure push symbols are non-empty and comma-free."""
+        return _check_push_symbols(v)
+
 
 class ComputeRequest(BaseModel):
     """Request model for computing string acceptance."""
@@ -94,7 +108,7 @@ class ValidationViolation(BaseModel):
 class ValidationResponse(BaseModel):
     """Response model for DPDA validation."""
     is_valid: bool = Field(..., description="Whether the DPDA is valid")
-    violations: List[Dict[str, Any]] = Field(
+    violations: List[ValidationViolation] = Field(
         default_factory=list,
         description="List of violations if invalid"
     )
@@ -123,16 +137,13 @@ class ExportResponse(BaseModel):
     version: str = Field(..., description="Export format version")
 
 
-class VisualizationFormat(str, Enum):
-    """Supported visualization formats."""
-    DOT = "dot"
-    D3 = "d3"
-    CYTOSCAPE = "cytoscape"
+# Supported visualization formats
+VisualizationFormat = Literal["dot", "d3", "cytoscape"]
 
 
 class VisualizationResponse(BaseModel):
     """Response model for DPDA visualization."""
-    format: str = Field(..., description="Visualization format")
+    format: VisualizationFormat = Field(..., description="Visualization format")
     data: Union[str, Dict[str, Any]] = Field(..., description="Visualization data")
 
 
@@ -177,12 +188,18 @@ class UpdateDPDARequest(BaseModel):
     description: Optional[str] = Field(None, description="New description for the DPDA")
 
 
+class DPDAChanges(BaseModel):
+    """Fields changed by a DPDA metadata update; unchanged fields are omitted."""
+    name: Optional[str] = Field(None, description="New DPDA name")
+    description: Optional[str] = Field(None, description="New DPDA description")
+
+
 class UpdateDPDAResponse(BaseModel):
     """Response model for DPDA update."""
     id: str = Field(..., description="DPDA identifier")
     updated: bool = Field(..., description="Whether update was successful")
     message: str = Field(..., description="Status message")
-    changes: Dict[str, Any] = Field(..., description="Dictionary of changed fields")
+    changes: DPDAChanges = Field(..., description="Changed fields")
 
 
 class UpdateStatesRequest(BaseModel):
@@ -203,11 +220,12 @@ class UpdateStatesRequest(BaseModel):
     def validate_state_membership(self) -> 'UpdateStatesRequest':
         """Validate that initial and accept states are in states list if both provided."""
         if self.states is not None:
-            if self.initial_state is not None and self.initial_state not in self.states:
+            states = set(self.states)
+            if self.initial_state is not None and self.initial_state not in states:
                 raise ValueError(f"Initial state '{self.initial_state}' must be in states list")
             if self.accept_states is not None:
                 for state in self.accept_states:
-                    if state not in self.states:
+                    if state not in states:
                         raise ValueError(f"Accept state '{state}' must be in states list")
         return self
 
@@ -235,9 +253,32 @@ class UpdateTransitionRequest(BaseModel):
     to_state: Optional[str] = Field(None, description="New target state")
     stack_push: Optional[List[str]] = Field(None, description="New symbols to push onto stack")
 
+    @field_validator('stack_push')
+    @classmethod
+    def validate_push_symbols(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        """Ensure push symbols are non-empty and comma-free."""
+        return v if v is None else _check_push_symbols(v)
+
+    @model_validator(mode='after')
+    def validate_not_empty(self) -> 'UpdateTransitionRequest':
+        """Reject updates that don't mention any transition field."""
+        # Explicit nulls count as provided; only an empty body is a no-op
+        if not self.model_fields_set:
+            raise ValueError("At least one transition field must be provided")
+        return self
+
+
+class TransitionChanges(BaseModel):
+    """Fields changed by a transition update; unchanged fields are omitted."""
+    from_state: Optional[str] = Field(None, description="New source state")
+    input_symbol: Optional[str] = Field(None, description="New input symbol")
+    stack_top: Optional[str] = Field(None, description="New stack top symbol")
+    to_state: Optional[str] = Field(None, description="New target state")
+    stack_push: Optional[List[str]] = Field(None, description="New symbols to push onto stack")
+
 
 class UpdateTransitionResponse(BaseModel):
     """Response model for transition update."""
     updated: bool = Field(..., description="Whether update was successful")
     message: str = Field(..., description="Status message")
-    changes: Dict[str, Any] = Field(..., description="Dictionary of changed fields")
\ No newline at end of file
+    changes: TransitionChanges = Field(..., description="Changed fields")
\ No newline at end of file
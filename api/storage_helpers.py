@@ -6,7 +6,9 @@ while the storage backend works with DPDABuilder objects (pure data).
 These helpers manage the conversion between the two.
 """
 
-from typing import Optional
+import threading
+from typing import Dict, List, Optional, Tuple
+import anyio
 from core.session import DPDASession, DPDABuilder
 from persistence.storage_adapter import get_storage_backend, StorageBackend
 
@@ -15,8 +17,23 @@ class SessionStorage:
     """Manages DPDA sessions with persistent storage backend."""
 
     def __init__(self):
-        """Initialize with configured storage backend."""
-        self.storage: StorageBackend = get_storage_backend()
+        """Initialize; the configured storage backend is created on first use."""
+        self._storage: Optional[StorageBackend] = None
+        self._storage_lock = threading.Lock()
+
+    @property
+    def storage(self) -> StorageBackend:
+        """Configured storage backend, created on first access rather than at import."""
+        if self._storage is None:
+            with self._storage_lock:
+                if self._storage is None:
+                    self._storage = get_storage_backend()
+        return self._storage
+
+    @property
+    def is_blocking(self) -> bool:
+        """Whether storage calls block, so async callers hand them to a worker thread."""
+        return self.storage.is_blocking
 
     def create_session(self, dpda_id: str, session_id: str, name: str) -> DPDASession:
         """
@@ -40,6 +57,20 @@ class SessionStorage:
 
         return session
 
+    async def acreate_session(self, dpda_id: str, session_id: str, name: str) -> DPDASession:
+        """
+        Create and store a new DPDA session without blocking the event loop.
+
+        Args:
+            dpda_id: DPDA identifier
+            session_id: Session identifier
+            name: DPDA name
+
+        Returns:
+            New DPDASession instance
+        """
+        return await self._run_storage(self.create_session, dpda_id, session_id, name)
+
     def get_session(self, dpda_id: str, session_id: str) -> Optional[DPDASession]:
         """
         Retrieve a DPDA session from storage.
@@ -51,27 +82,71 @@ class SessionStorage:
         Returns:
             DPDASession instance if found, None otherwise
         """
-        # Load builder from storage
-        builder = self.storage.get_dpda(dpda_id, session_id)
-        if builder is None:
+        # Load builder and name from storage in one lookup
+        stored = self.storage.get_dpda_with_name(dpda_id, session_id)
+        if stored is None:
             return None
 
-        # Get DPDA metadata to retrieve the actual name
-        dpdas_list = self.storage.list_dpdas(session_id)
-        dpda_name = None
-        for dpda_info in dpdas_list:
-            if dpda_info['id'] == dpda_id:
-                dpda_name = dpda_info.get('name', f"dpda_{dpda_id}")
-                break
+        builder, dpda_name = stored
+        return self._session_from_builder(dpda_id, dpda_name, builder)
+
+    async def aget_session(self, dpda_id: str, session_id: str) -> Optional[DPDASession]:
+        """
+        Retrieve a DPDA session from storage without blocking the event loop.
+
+        Blocking backends are called from a worker thread; the in-memory
+        backend is called inline to avoid the thread hop.
+
+        Args:
+            dpda_id: DPDA identifier
+            session_id: Session identifier
+
+        Returns:
+            DPDASession instance if found, None otherwise
+        """
+        return await self._run_storage(self.get_session, dpda_id, session_id)
+
+    def get_builder(self, dpda_id: str, session_id: str) -> Optional[DPDABuilder]:
+        """
+        Retrieve just a DPDA's builder from storage.
+
+        For read-only callers that don't need the DPDASession wrapper (and
+        its name lookup).
+
+        Args:
+            dpda_id: DPDA identifier
+            session_id: Session identifier
+
+        Returns:
+            DPDABuilder instance if found, None otherwise
+        """
+        return self.storage.get_dpda(dpda_id, session_id)
+
+    async def aget_builder(self, dpda_id: str, session_id: str) -> Optional[DPDABuilder]:
+        """
+        Retrieve just a DPDA's builder without blocking the event loop.
+
+        Args:
+            dpda_id: DPDA identifier
+            session_id: Session identifier
 
-        if dpda_name is None:
-            dpda_name = f"dpda_{dpda_id}"
+        Returns:
+            DPDABuilder instance if found, None otherwise
+        """
+        return await self._run_storage(self.get_builder, dpda_id, session_id)
 
-        # Reconstruct session from builder
+    async def _run_storage(self, func, *args):
+        """Call a storage-bound method, in a worker thread if the backend blocks."""
+        if self.is_blocking:
+            return await anyio.to_thread.run_sync(func, *args)
+        return func(*args)
+
+    @staticmethod
+    def _session_from_builder(dpda_id: str, dpda_name: str, builder: DPDABuilder) -> DPDASession:
+        """Reconstruct a DPDASession around a stored builder."""
         session = DPDASession(name=f"session_{dpda_id}")
         session.dpdas[dpda_name] = builder
         session.current_dpda_name = dpda_name
-
         return session
 
     def update_session(self, dpda_id: str, session_id: str, session: DPDASession, name: str = None) -> bool:
@@ -90,6 +165,21 @@ class SessionStorage:
         builder = session.get_current_builder()
         return self.storage.update_dpda(dpda_id, session_id, builder, name=name)
 
+    async def aupdate_session(self, dpda_id: str, session_id: str, session: DPDASession, name: str = None) -> bool:
+        """
+        Update a DPDA session in storage without blocking the event loop.
+
+        Args:
+            dpda_id: DPDA identifier
+            session_id: Session identifier
+            session: Updated DPDASession instance
+            name: New DPDA name (optional, updates the record name if provided)
+
+        Returns:
+            True if updated successfully, False if not found
+        """
+        return await self._run_storage(self.update_session, dpda_id, session_id, session, name)
+
     def delete_session(self, dpda_id: str, session_id: str) -> bool:
         """
         Delete a DPDA session from storage.
@@ -103,6 +193,19 @@ class SessionStorage:
         """
         return self.storage.delete_dpda(dpda_id, session_id)
 
+    async def adelete_session(self, dpda_id: str, session_id: str) -> bool:
+        """
+        Delete a DPDA session from storage without blocking the event loop.
+
+        Args:
+            dpda_id: DPDA identifier
+            session_id: Session identifier
+
+        Returns:
+            True if deleted successfully, False if not found
+        """
+        return await self._run_storage(self.delete_session, dpda_id, session_id)
+
     def exists(self, dpda_id: str, session_id: str) -> bool:
         """
         Check if a DPDA session exists.
@@ -128,6 +231,35 @@ class SessionStorage:
         """
         return self.storage.list_dpdas(session_id)
 
+    def list_sessions_full(self, session_id: str) -> List[Tuple[Dict, DPDASession]]:
+        """
+        List all DPDA sessions for a given session ID, loaded in one pass.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            List of (DPDA metadata dictionary, DPDASession) tuples
+        """
+        return [
+            (info, self._session_from_builder(
+                info['id'], info.get('name', f"dpda_{info['id']}"), builder
+            ))
+            for info, builder in self.storage.list_dpdas_with_builders(session_id)
+        ]
+
+    async def alist_sessions_full(self, session_id: str) -> List[Tuple[Dict, DPDASession]]:
+        """
+        List all DPDA sessions for a given session ID without blocking the event loop.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            List of (DPDA metadata dictionary, DPDASession) tuples
+        """
+        return await self._run_storage(self.list_sessions_full, session_id)
+
 
 # Global instance
 session_storage = SessionStorage()
@@ -3,7 +3,8 @@ CLI interface for DPDA simulator.
 Handles user interaction for setting up and running DPDA simulations.
 """
 
-from typing import Set, List, Optional, Dict
+import sys
+from typing import Set, List, Optional, Dict, Sequence, Tuple
 from models.dpda_definition import DPDADefinition
 from models.transition import Transition
 from models.configuration import Configuration
@@ -13,6 +14,18 @@ from validation.dpda_validator import DPDAValidator
 from cli_io.formatter import OutputFormatter
 
 
+# Special answers to symbol prompts: raw input -> (symbol, check against alphabet)
+# '-' and '' mean epsilon, '--' is the literal '-' symbol
+SYMBOL_ESCAPES: Dict[str, Tuple[Optional[str], bool]] = {
+    '-': (None, False),
+    '': (None, False),
+    '--': ('-', True),
+}
+
+# Per-state transition index: (input_symbol, stack_top) -> (entry order, transition)
+TransitionBucket = Dict[Tuple[Optional[str], Optional[str]], Tuple[int, Transition]]
+
+
 class CLIInterface:
     """Manages command-line interaction for DPDA simulator."""
 
@@ -21,6 +34,40 @@ class CLIInterface:
         self.formatter = OutputFormatter()
         self.validator = DPDAValidator()
         self.engine = DPDAEngine()
+        self._by_state: Dict[str, TransitionBucket] = {}
+        # (from_state, input_symbol, stack_top, to_state) -> transition of _trans_index_dpda
+        self._trans_index: Dict[Tuple[str, Optional[str], Optional[str], str], Transition] = {}
+        self._trans_index_dpda: Optional[DPDADefinition] = None
+
+        # Piped stdin is read straight from its binary buffer, skipping the
+        # per-call flushes of input(); a terminal or a replaced sys.stdin
+        # (e.g. under test) keeps using input()
+        self._stdin = None
+        if sys.stdin is not None and sys.stdin is sys.__stdin__ and not sys.stdin.isatty():
+            self._stdin = sys.stdin.buffer
+
+    def _readline(self, prompt: str = '') -> str:
+        """
+        Read a line of user input, like input().
+
+        Args:
+            prompt: Text written to stdout before reading
+
+        Returns:
+            The line without its trailing newline
+
+        Raises:
+            EOFError: If stdin is exhausted
+        """
+        if self._stdin is None:
+            return input(prompt)
+
+        if prompt:
+            sys.stdout.write(prompt)
+        line = self._stdin.readline()
+        if not line:
+            raise EOFError
+        return line.decode(sys.stdin.encoding or 'utf-8').rstrip('\r\n')
 
     def collect_states(self) -> Set[str]:
         """
@@ -31,7 +78,7 @@ class CLIInterface:
         """
         while True:
             try:
-                num_states = int(input("Enter number of states :\n"))
+                num_states = int(self._readline("Enter number of states :\n"))
                 # Return set of state names
                 return {str(i) for i in range(num_states)}
             except ValueError:
@@ -47,7 +94,7 @@ class CLIInterface:
             Set of input symbols
         """
         while True:
-            user_input = input(
+            user_input = self._readline(
                 "Enter input alphabet as a comma-separated list of symbols :\n"
             ).strip()
 
@@ -56,7 +103,7 @@ class CLIInterface:
                 continue
 
             # Split by comma and clean up whitespace
-            symbols = {s.strip() for s in user_input.split(',') if s.strip()}
+            symbols = set(filter(None, map(str.strip, user_input.split(','))))
 
             if not symbols:
                 print("Input alphabet can't be empty")
@@ -77,7 +124,7 @@ class CLIInterface:
         num_states = len(states)
         while True:
             try:
-                user_input = input(
+                user_input = self._readline(
                     "Enter accepting states as a comma-separated list of integers :\n"
                 ).strip()
 
@@ -86,8 +133,7 @@ class CLIInterface:
                     return set()
 
                 # Parse state numbers
-                accept_nums = []
-                state_nums = list(map(int, user_input.split(',')))
+                state_nums = [int(part) for part in user_input.split(',')]
 
                 # Check max value
                 max_state = max(state_nums)
@@ -95,10 +141,7 @@ class CLIInterface:
                     print(f"invalid state {max_state}; enter a value between 0 and {num_states - 1}")
                     continue
 
-                for state_num in state_nums:
-                    accept_nums.append(str(state_num))
-
-                return set(accept_nums)
+                return {str(state_num) for state_num in state_nums}
 
             except (ValueError, IndexError):
                 print("Invalid input: accept state must be integers")
@@ -124,7 +167,7 @@ class CLIInterface:
         """
         # Ask if user wants to add a transition
         while True:
-            response = input(
+            response = self._readline(
                 f"Need a transition rule for state {state} ? (y or n)\n"
             ).strip().lower()
 
@@ -137,59 +180,27 @@ class CLIInterface:
 
         # Collect input symbol
         while True:
-            input_sym = input(
-                "Input Symbol to read (enter - for epsilon, enter -- for '-'): "
+            input_sym, known = self._parse_symbol(
+                self._readline("Input Symbol to read (enter - for epsilon, enter -- for '-'): "),
+                input_alphabet,
+                add_unknown=False
             )
-
-            # Convert '-' to None for epsilon, '--' to '-'
-            if input_sym == '-':
-                input_sym = None
-                break
-            elif input_sym == '--':
-                input_sym = '-'
-                if input_sym in input_alphabet:
-                    break
-                else:
-                    print("Invalid input: symbol not in alphabet")
-            elif input_sym == '':
-                # Empty string also means epsilon
-                input_sym = None
-                break
-            elif input_sym in input_alphabet:
-                break
-            else:
-                print("Invalid input: symbol not in alphabet")
-
-        # Collect stack top symbol
-        while True:
-            stack_top = input(
-                "Stack symbol to match and pop (enter - for epsilon, enter -- for '-'): "
-            )
-
-            # Convert '-' to None for epsilon, '--' to '-'
-            if stack_top == '-':
-                stack_top = None
-                break
-            elif stack_top == '--':
-                stack_top = '-'
-                # Always add new stack symbols to alphabet
-                stack_alphabet.add(stack_top)
-                break
-            elif stack_top == '':
-                # Empty string also means epsilon
-                stack_top = None
-                break
-            elif stack_top in stack_alphabet:
-                break
-            else:
-                # Add new stack symbol to alphabet (like original)
-                stack_alphabet.add(stack_top)
+            if known:
                 break
+            print("Invalid input: symbol not in alphabet")
+
+        # Collect stack top symbol; new stack symbols are added to the alphabet
+        # (like original), so any answer is accepted
+        stack_top, _ = self._parse_symbol(
+            self._readline("Stack symbol to match and pop (enter - for epsilon, enter -- for '-'): "),
+            stack_alphabet,
+            add_unknown=True
+        )
 
         # Collect next state
         while True:
             try:
-                next_state = int(input("State to transition to : "))
+                next_state = int(self._readline("State to transition to : "))
                 if num_states and next_state >= num_states:
                     print(f"Invalid input: input greater than {num_states}")
                     continue
@@ -199,7 +210,7 @@ class CLIInterface:
                 print("Invalid input: state must be integer")
 
         # Collect symbols to push (comma-separated like original)
-        push_input = input(
+        push_input = self._readline(
             "Stack symbols to push as comma separated list, first symbol to top of stack (enter - for epsilon, enter -- for '-'): "
         )
 
@@ -232,11 +243,37 @@ class CLIInterface:
 
         return Transition(state, input_sym, stack_top, next_state, push_symbols)
 
+    def _parse_symbol(
+        self,
+        raw: str,
+        alphabet: Set[str],
+        add_unknown: bool
+    ) -> Tuple[Optional[str], bool]:
+        """
+        Parse the answer to an input or stack symbol prompt.
+
+        Args:
+            raw: Text entered by the user
+            alphabet: Alphabet the symbol must belong to
+            add_unknown: Add symbols missing from alphabet instead of rejecting them
+
+        Returns:
+            Tuple of (symbol or None for epsilon, whether the symbol is accepted)
+        """
+        symbol, check = SYMBOL_ESCAPES.get(raw, (raw, True))
+        if not check or symbol in alphabet:
+            return symbol, True
+        if add_unknown:
+            alphabet.add(symbol)
+            return symbol, True
+        return symbol, False
+
     def collect_all_transitions(
         self,
         states: Set[str],
         input_alphabet: Set[str],
-        stack_alphabet: Set[str]
+        stack_alphabet: Set[str],
+        ordered_states: Optional[Sequence[str]] = None
     ) -> List[Transition]:
         """
         Collect all transitions for the DPDA.
@@ -245,22 +282,27 @@ class CLIInterface:
             states: Set of all states
             input_alphabet: Set of input symbols
             stack_alphabet: Set of stack symbols
+            ordered_states: The states in numeric order, if already known
+                            (defaults to sorting states)
 
         Returns:
             List of transitions
         """
         transitions = []
         num_states = len(states)
+        self._by_state = {}
 
         # Collect transitions for each state
-        for state_num in sorted(states, key=int):
-            print(f"Transitions for state {state_num}:")
+        if ordered_states is None:
+            ordered_states = sorted(states, key=int)
+        for state_num in ordered_states:
+            bucket = self._by_state.setdefault(state_num, {})
 
-            # Display existing transitions for this state (if any)
-            state_transitions = [t for t in transitions if t.from_state == state_num]
-            if state_transitions:
-                for trans in state_transitions:
-                    print(self.format_transition_display(trans))
+            # Display the state header and its existing transitions (if any)
+            print('\n'.join([
+                f"Transitions for state {state_num}:",
+                *(self.format_transition_display(trans) for _, trans in bucket.values())
+            ]))
 
             # Collect new transitions for this state
             while True:
@@ -275,75 +317,117 @@ class CLIInterface:
                     break
 
                 # Check for determinism violations
-                violation_msg = self._check_determinism_violation(trans, transitions, state_num)
+                violation_msg = self._check_determinism_violation(trans, bucket, state_num)
                 if violation_msg:
                     print(violation_msg)
                     continue
 
+                # collect_transition has already added any new stack symbols
+                # to stack_alphabet while parsing them
                 transitions.append(trans)
-                # Update stack alphabet if new symbols introduced
-                if trans.stack_push and trans.stack_push != '-':
-                    # Split by comma to get individual symbols
-                    symbols = trans.stack_push.split(',')
-                    for symbol in symbols:
-                        stack_alphabet.add(symbol)
+                bucket[(trans.input_symbol, trans.stack_top)] = (len(bucket), trans)
 
         return transitions
 
     def _check_determinism_violation(
         self,
         new_trans: Transition,
-        existing: List[Transition],
+        bucket: TransitionBucket,
         state: str = None
     ) -> Optional[str]:
         """
         Check if adding a transition would violate DPDA determinism.
 
+        Only transitions that can conflict with new_trans are looked up in
+        the state's index; when several conflict, the earliest entered one
+        is reported.
+
         Args:
             new_trans: New transition to add
-            existing: List of existing transitions
+            bucket: Existing transitions from new_trans.from_state, indexed
+                by (input_symbol, stack_top)
             state: Current state (for error messages)
 
         Returns:
             Error message if violation would occur, None otherwise
         """
-        for trans in existing:
-            # Check for exact match (violation of property a)
-            if (trans.from_state == new_trans.from_state and
-                trans.input_symbol == new_trans.input_symbol and
-                trans.stack_top == new_trans.stack_top):
-                # Format transition for error message matching original
-                trans_str = self.format_transition_display(trans)
-                if new_trans.input_symbol is None and new_trans.stack_top is None:
-                    # Epsilon/epsilon transition attempt
-                    return f"Violation of DPDA due to epsilon input/epsilon stack transition from state {state or trans.from_state}:{trans_str}"
-                elif new_trans.stack_top is None:
-                    # Epsilon stack transition
-                    return f"Violation of DPDA due to epsilon stack transition from state {state or trans.from_state}:{trans_str}"
-                else:
-                    # Multiple transitions for same input and stack
-                    return f"Violation of DPDA due to multiple transitions for the same input and stack top from state {state or trans.from_state}:{trans_str}"
-
-            # Check epsilon/non-epsilon conflict (property b)
-            if trans.from_state == new_trans.from_state:
-                if trans.stack_top == new_trans.stack_top:
-                    # One has epsilon input, other doesn't
-                    if (trans.input_symbol is None) != (new_trans.input_symbol is None):
-                        if trans.input_symbol is None:
-                            return f"Violation of DPDA: epsilon and non-epsilon transitions from same state {state or trans.from_state} with same stack"
-                        else:
-                            return f"Violation of DPDA: non-epsilon and epsilon transitions from same state {state or trans.from_state} with same stack"
-
-                # Check for epsilon stack conflicts
-                # Can't add epsilon stack transition if specific stack already exists
-                if (trans.input_symbol == new_trans.input_symbol and
-                    trans.stack_top is not None and new_trans.stack_top is None):
-                    return f"Violation of DPDA due to epsilon stack transition from state {state or trans.from_state}:{self.format_transition_display(trans)}"
-
-                # Can't add specific stack if epsilon stack already exists
-                if (trans.input_symbol == new_trans.input_symbol and
-                    trans.stack_top is None and new_trans.stack_top is not None):
-                    return f"Violation of DPDA due to epsilon stack already exists from state {state or trans.from_state}:{self.format_transition_display(trans)}"
+        input_symbol = new_trans.input_symbol
+        stack_top = new_trans.stack_top
+
+        if input_symbol is None or stack_top is None:
+            # Epsilon transitions conflict with whole groups of keys
+            candidates = [
+                entry for (inp, top), entry in bucket.items()
+                if (top == stack_top and (inp is None) != (input_symbol is None))
+                or (inp == input_symbol and (top == stack_top or top is None or stack_top is None))
+            ]
+        else:
+            candidates = [
+                bucket[key]
+                for key in ((input_symbol, stack_top), (None, stack_top), (input_symbol, None))
+                if key in bucket
+            ]
+
+        for _, trans in sorted(candidates, key=lambda entry: entry[0]):
+            violation = self._describe_violation(trans, new_trans, state)
+            if violation:
+                return violation
+
+        return None
+
+    def _describe_violation(
+        self,
+        trans: Transition,
+        new_trans: Transition,
+        state: str = None
+    ) -> Optional[str]:
+        """
+        Describe the determinism conflict between two transitions, if any.
+
+        Args:
+            trans: Existing transition
+            new_trans: New transition to add
+            state: Current state (for error messages)
+
+        Returns:
+            Error message if the transitions conflict, None otherwise
+        """
+        # Check for exact match (violation of property a)
+        if (trans.from_state == new_trans.from_state and
+            trans.input_symbol == new_trans.input_symbol and
+            trans.stack_top == new_trans.stack_top):
+            # Format transition for error message matching original
+            trans_str = self.format_transition_display(trans)
+            if new_trans.input_symbol is None and new_trans.stack_top is None:
+                # Epsilon/epsilon transition attempt
+                return f"Violation of DPDA due to epsilon input/epsilon stack transition from state {state or trans.from_state}:{trans_str}"
+            elif new_trans.stack_top is None:
+                # Epsilon stack transition
+                return f"Violation of DPDA due to epsilon stack transition from state {state or trans.from_state}:{trans_str}"
+            else:
+                # Multiple transitions for same input and stack
+                return f"Violation of DPDA due to multiple transitions for the same input and stack top from state {state or trans.from_state}:{trans_str}"
+
+        # Check epsilon/non-epsilon conflict (property b)
+        if trans.from_state == new_trans.from_state:
+            if trans.stack_top == new_trans.stack_top:
+                # One has epsilon input, other doesn't
+                if (trans.input_symbol is None) != (new_trans.input_symbol is None):
+                    if trans.input_symbol is None:
+                        return f"Violation of DPDA: epsilon and non-epsilon transitions from same state {state or trans.from_state} with same stack"
+                    else:
+                        return f"Violation of DPDA: non-epsilon and epsilon transitions from same state {state or trans.from_state} with same stack"
+
+            # Check for epsilon stack conflicts
+            # Can't add epsilon stack transition if specific stack already exists
+            if (trans.input_symbol == new_trans.input_symbol and
+                trans.stack_top is not None and new_trans.stack_top is None):
+                return f"Violation of DPDA due to epsilon stack transition from state {state or trans.from_state}:{self.format_transition_display(trans)}"
+
+            # Can't add specific stack if epsilon stack already exists
+            if (trans.input_symbol == new_trans.input_symbol and
+                trans.stack_top is None and new_trans.stack_top is not None):
+                return f"Violation of DPDA due to epsilon stack already exists from state {state or trans.from_state}:{self.format_transition_display(trans)}"
 
         return None
 
@@ -363,21 +447,37 @@ class CLIInterface:
             transition.stack_push
         )
 
-    def display_transitions(self, transitions: List[Transition], num_states: int):
+    def display_transitions(
+        self,
+        transitions: List[Transition],
+        num_states: int,
+        ordered_states: Optional[Sequence[str]] = None
+    ):
         """
         Display all transitions grouped by state.
 
         Args:
             transitions: List of transitions
             num_states: Total number of states
+            ordered_states: The states '0'..num_states-1 in order, if already
+                            known (defaults to building them from num_states)
         """
-        for state_num in range(num_states):
-            state = str(state_num)
-            print(f"Transitions for state {state_num}:")
-
-            state_transitions = [t for t in transitions if t.from_state == state]
-            for trans in state_transitions:
-                print(self.format_transition_display(trans))
+        if ordered_states is None:
+            ordered_states = tuple(str(i) for i in range(num_states))
+
+        # Group in one pass, then write everything with a single print
+        by_state: Dict[str, List[str]] = {state: [] for state in ordered_states}
+        for trans in transitions:
+            lines = by_state.get(trans.from_state)
+            if lines is not None:
+                lines.append(self.format_transition_display(trans))
+
+        output: List[str] = []
+        for state in ordered_states:
+            output.append(f"Transitions for state {state}:")
+            output.extend(by_state[state])
+        if output:
+            print('\n'.join(output))
 
     def process_input_string(self, dpda: DPDADefinition, engine: DPDAEngine):
         """
@@ -389,7 +489,7 @@ class CLIInterface:
         """
         # Get input string from user
         try:
-            input_string = input("Enter an input string to be processed by the PDA : ")
+            input_string = self._readline("Enter an input string to be processed by the PDA : ")
         except EOFError:
             # EOF reached - exit gracefully without exception
             return False
@@ -402,8 +502,8 @@ class CLIInterface:
 
         # Format and display trace
         # Note: We need to get transitions from the result or compute them separately
-        if hasattr(result, 'configurations'):
-            # For testing - mock object has these attributes
+        if result.configurations is not None:
+            # Transitions supplied with the result (e.g. by tests)
             trace = self.formatter.format_computation_trace(
                 result.configurations,
                 result.transitions,
@@ -412,29 +512,34 @@ class CLIInterface:
             print(trace)
         elif result.trace:
             # For real ComputationResult - format the trace with transitions
-            trace_str = ""
-            for i, config in enumerate(result.trace):
-                trace_str += self.formatter.format_configuration(config)
-                if i < len(result.trace) - 1:
-                    # Try to find the transition that was taken
-                    curr_config = result.trace[i]
-                    next_config = result.trace[i + 1]
-                    transition_str = self._find_transition_between_configs(
-                        dpda, curr_config, next_config
-                    )
-                    trace_str += f"--{transition_str}-->"
-            print(trace_str)
+            trace = result.trace
+            stack_str = self.formatter.format_stack(trace[0].stack)
+            parts: List[str] = [self.formatter.format_configuration(trace[0], stack_str)]
+            for i in range(1, len(trace)):
+                # Try to find the transition that was taken
+                curr_config = trace[i - 1]
+                next_config = trace[i]
+                transition = self._match_transition(dpda, curr_config, next_config)
+                transition_str = self._find_transition_between_configs(
+                    dpda, curr_config, next_config, transition
+                )
+                parts.append(f"--{transition_str}-->")
+                stack_str = self.formatter.format_stack_step(
+                    curr_config.stack, stack_str, next_config.stack, transition
+                )
+                parts.append(self.formatter.format_configuration(next_config, stack_str))
+            print(''.join(parts))
 
         return True
 
-    def _find_transition_between_configs(
+    def _match_transition(
         self,
         dpda,
         curr_config: 'Configuration',
         next_config: 'Configuration'
-    ) -> str:
+    ) -> Optional[Transition]:
         """
-        Find and format the transition taken between two configurations.
+        Find the DPDA transition taken between two configurations.
 
         Args:
             dpda: The DPDA definition
@@ -442,7 +547,7 @@ class CLIInterface:
             next_config: Next configuration
 
         Returns:
-            Formatted transition string like "[a,$->X]"
+            The matching transition, or None if there is none
         """
         # Determine what input was consumed
         if len(curr_config.remaining_input) > len(next_config.remaining_input):
@@ -456,23 +561,60 @@ class CLIInterface:
         else:
             stack_top = None
 
-        # Find matching transition in DPDA
-        for trans in dpda.transitions:
-            if (trans.from_state == curr_config.state and
-                trans.input_symbol == input_consumed and
-                trans.stack_top == stack_top and
-                trans.to_state == next_config.state):
-                # Found the transition - format it
-                return self.formatter.format_transition(trans)
+        # Find matching transition in DPDA; the index is built once per DPDA
+        # and reused for every step of every string processed with it
+        if self._trans_index_dpda is not dpda:
+            index: Dict[Tuple[str, Optional[str], Optional[str], str], Transition] = {}
+            for trans in dpda.transitions:
+                index.setdefault(
+                    (trans.from_state, trans.input_symbol, trans.stack_top, trans.to_state),
+                    trans
+                )
+            self._trans_index = index
+            self._trans_index_dpda = dpda
+
+        return self._trans_index.get(
+            (curr_config.state, input_consumed, stack_top, next_config.state)
+        )
+
+    def _find_transition_between_configs(
+        self,
+        dpda,
+        curr_config: 'Configuration',
+        next_config: 'Configuration',
+        transition: Optional[Transition] = None
+    ) -> str:
+        """
+        Find and format the transition taken between two configurations.
+
+        Args:
+            dpda: The DPDA definition
+            curr_config: Current configuration
+            next_config: Next configuration
+            transition: Result of _match_transition, if already known
+
+        Returns:
+            Formatted transition string like "[a,$->X]"
+        """
+        if transition is None:
+            transition = self._match_transition(dpda, curr_config, next_config)
+        if transition is not None:
+            # Found the transition - format it
+            return self.format_transition_display(transition)
+
+        input_consumed = curr_config.remaining_input[0] if (
+            len(curr_config.remaining_input) > len(next_config.remaining_input)) else None
+        stack_top = curr_config.stack[0] if curr_config.stack else None
 
         # If no exact match found, create a generic transition string
         input_str = input_consumed if input_consumed else 'eps'
         stack_str = stack_top if stack_top else 'eps'
-        # Determine what was pushed
-        if len(next_config.stack) > len(curr_config.stack) - 1:
-            # Something was pushed
-            pushed = next_config.stack[:len(next_config.stack) - len(curr_config.stack) + 1]
-            push_str = ','.join(reversed(pushed)) if pushed else 'eps'
+        # Determine what was pushed: at most one symbol is popped, so the
+        # top len_delta + 1 symbols are new
+        len_delta = len(next_config.stack) - len(curr_config.stack)
+        if len_delta >= 0:
+            # Something was pushed; slice the new symbols already reversed
+            push_str = ','.join(next_config.stack[len_delta::-1]) or 'eps'
         else:
             push_str = 'eps'
 
@@ -491,13 +633,16 @@ class CLIInterface:
 
             accept_states = self.collect_accept_states(states)
 
+            # Numeric state order, shared by collection and display
+            ordered_states = tuple(sorted(states, key=int))
+
             # Collect transitions
             transitions = self.collect_all_transitions(
-                states, input_alphabet, stack_alphabet
+                states, input_alphabet, stack_alphabet, ordered_states
             )
 
             # Display all transitions
-            self.display_transitions(transitions, len(states))
+            self.display_transitions(transitions, len(states), ordered_states)
 
             # The original DPDA starts with an EMPTY stack
             initial_stack = ''
@@ -521,7 +666,9 @@ class CLIInterface:
             result = self.validator.validate(dpda)
             if not result.is_valid:
                 # Filter out stack alphabet errors - the original allows this
-                critical_errors = [e for e in result.errors if "stack symbol" not in e.lower()]
+                critical_errors = [
+                    v.description for v in result.violations if v.kind != 'stack_symbol'
+                ]
                 if critical_errors:
                     print("DPDA validation failed:")
                     for error in critical_errors:
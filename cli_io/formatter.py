@@ -3,11 +3,45 @@ Output formatter for DPDA simulator.
 Handles formatting of transitions, configurations, and computation traces.
 """
 
+import sys
+from functools import lru_cache
 from typing import Optional, List, Tuple, Union
 from models.configuration import Configuration
 from models.transition import Transition
 
 
+# Symbol values displayed as "eps"
+_EPSILON_DISPLAY = {None: "eps", '': "eps"}
+
+
+# States and transitions come from a small fixed set per DPDA but are
+# formatted at every step of every trace, so their display strings are
+# memoized at module level (keeping the formatter instance out of the key).
+@lru_cache(maxsize=1024)
+def _format_transition(
+    input_symbol: Optional[str],
+    stack_top: Optional[str],
+    push_symbols: str
+) -> str:
+    """Build the [input,stack_top->push] display string for a transition."""
+    # Convert None and '' to "eps" for display
+    input_str = _EPSILON_DISPLAY.get(input_symbol, input_symbol)
+    stack_str = _EPSILON_DISPLAY.get(stack_top, stack_top)
+    push_str = _EPSILON_DISPLAY.get(push_symbols, push_symbols)
+
+    return sys.intern(f"[{input_str},{stack_str}->{push_str}]")
+
+
+@lru_cache(maxsize=1024)
+def _format_state(state: str) -> str:
+    """Build the display string for a state."""
+    # If state is numeric string, add 'q' prefix
+    if state.isdigit():
+        return sys.intern(f"q{state}")
+    # If already has prefix or non-numeric, return as-is
+    return state
+
+
 class OutputFormatter:
     """Formats DPDA output for display."""
 
@@ -28,28 +62,24 @@ class OutputFormatter:
         Returns:
             Formatted transition string
         """
-        # Convert None to "eps" for display
-        input_str = "eps" if input_symbol is None or input_symbol == '' else input_symbol
-        stack_str = "eps" if stack_top is None or stack_top == '' else stack_top
-        push_str = "eps" if push_symbols == '' else push_symbols
-
-        return f"[{input_str},{stack_str}->{push_str}]"
+        return _format_transition(input_symbol, stack_top, push_symbols)
 
-    def format_configuration(self, config: Configuration) -> str:
+    def format_configuration(self, config: Configuration, stack_str: Optional[str] = None) -> str:
         """
         Format a configuration in the form (state;input;stack).
 
         Args:
             config: Configuration object
+            stack_str: Already formatted stack, if known (see format_stack_step)
 
         Returns:
             Formatted configuration string
         """
-        state_str = self.format_state(config.state)
         input_str = self.format_input(config.remaining_input)
-        stack_str = self.format_stack(config.stack)
+        if stack_str is None:
+            stack_str = self.format_stack(config.stack)
 
-        return f"({state_str};{input_str};{stack_str})"
+        return f"({_format_state(config.state)};{input_str};{stack_str})"
 
     def format_state(self, state: str) -> str:
         """
@@ -61,11 +91,7 @@ class OutputFormatter:
         Returns:
             Formatted state (with 'q' prefix if numeric)
         """
-        # If state is numeric string, add 'q' prefix
-        if state.isdigit():
-            return f"q{state}"
-        # If already has prefix or non-numeric, return as-is
-        return state
+        return _format_state(state)
 
     def format_input(self, input_str: str) -> str:
         """
@@ -103,6 +129,47 @@ class OutputFormatter:
             # Display with bottom first
             return ''.join(reversed(stack))
 
+    def format_stack_step(
+        self,
+        prev_stack: List[str],
+        prev_str: str,
+        stack: List[str],
+        transition: Optional[Transition]
+    ) -> str:
+        """
+        Format a stack reached from prev_stack by a single transition.
+
+        A step pops at most one symbol and pushes a few, so the previous
+        display string is spliced instead of reversing the whole stack
+        again. Falls back to format_stack when the stacks don't line up
+        with the transition.
+
+        Args:
+            prev_stack: Stack before the transition (top at index 0)
+            prev_str: format_stack(prev_stack)
+            stack: Stack after the transition
+            transition: Transition taken, or None if unknown
+
+        Returns:
+            Formatted stack or "eps" if empty
+        """
+        if transition is None or not isinstance(stack, list) or not isinstance(prev_stack, list):
+            return self.format_stack(stack)
+
+        push = transition.push_symbols
+        popped = (transition.stack_top is not None and bool(prev_stack)
+                  and prev_stack[0] == transition.stack_top)
+        if (len(stack) != len(prev_stack) - popped + len(push)
+                or stack[:len(push)] != list(push)):
+            return self.format_stack(stack)
+
+        if not stack:
+            return "eps"
+        base = prev_str if prev_stack else ''
+        if popped:
+            base = base[:len(base) - len(prev_stack[0])]
+        return base + ''.join(reversed(push))
+
     def format_computation_trace(
         self,
         configurations: List[Configuration],
@@ -126,7 +193,8 @@ class OutputFormatter:
         trace_parts = []
 
         # Add initial configuration
-        trace_parts.append(self.format_configuration(configurations[0]))
+        stack_str = self.format_stack(configurations[0].stack)
+        trace_parts.append(self.format_configuration(configurations[0], stack_str))
 
         # Add each transition and resulting configuration
         for i, transition in enumerate(transitions):
@@ -139,8 +207,12 @@ class OutputFormatter:
                 )
                 trace_parts.append(f"--{trans_str}-->")
 
-                # Add the next configuration
-                trace_parts.append(self.format_configuration(configurations[i + 1]))
+                # Add the next configuration, splicing its stack from the previous one
+                stack_str = self.format_stack_step(
+                    configurations[i].stack, stack_str,
+                    configurations[i + 1].stack, transition
+                )
+                trace_parts.append(self.format_configuration(configurations[i + 1], stack_str))
 
         return "".join(trace_parts)
 
@@ -14,46 +14,67 @@ Usage:
 """
 
 import os
+from functools import cached_property
 from pathlib import Path
 from typing import List
 
 
+# The .env file is read by the first Config() only
+_env_file_loaded = False
+
+
 class Config:
-    """Application configuration loaded from environment variables."""
+    """
+    Application configuration loaded from environment variables.
+
+    Each setting is parsed from the environment on first access and then
+    cached on the instance; use override_config() to change a setting
+    after it has been read.
+    """
 
     def __init__(self):
         """Initialize configuration by loading .env file if present."""
         self._load_env_file()
 
     def _load_env_file(self):
-        """Load environment variables from .env file if it exists."""
+        """Load environment variables from .env file if it exists (once per process)."""
+        global _env_file_loaded
+        if _env_file_loaded:
+            return
+        _env_file_loaded = True
+
         env_file = Path(__file__).parent / '.env'
-        if env_file.exists():
-            with open(env_file) as f:
-                for line in f:
-                    line = line.strip()
-                    # Skip empty lines and comments
-                    if not line or line.startswith('#'):
-                        continue
-                    # Parse KEY=VALUE
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip()
-                        # Only set if not already in environment
-                        if key not in os.environ:
-                            os.environ[key] = value
+        try:
+            content = env_file.read_text()
+        except FileNotFoundError:
+            return
+
+        for line in content.splitlines():
+            line = line.strip()
+            # Skip empty lines and comments
+            if not line or line.startswith('#'):
+                continue
+            # Parse KEY=VALUE
+            if '=' in line:
+                key, value = line.split('=', 1)
+                # Only set if not already in environment
+                os.environ.setdefault(key.strip(), value.strip())
 
     # ========================================================================
     # STORAGE CONFIGURATION
     # ========================================================================
 
-    @property
+    @cached_property
     def STORAGE_BACKEND(self) -> str:
         """Storage backend type: 'memory' or 'database'."""
         return os.getenv('STORAGE_BACKEND', 'memory').lower()
 
-    @property
+    @cached_property
+    def MEMORY_MAX_DPDAS(self) -> int:
+        """Maximum DPDAs held by the memory backend before LRU eviction."""
+        return int(os.getenv('MEMORY_MAX_DPDAS', '10000'))
+
+    @cached_property
     def DATABASE_URL(self) -> str:
         """Database connection URL."""
         return os.getenv('DATABASE_URL', 'sqlite:///./dpda_sessions.db')
@@ -62,22 +83,22 @@ class Config:
     # API SERVER CONFIGURATION
     # ========================================================================
 
-    @property
+    @cached_property
     def API_HOST(self) -> str:
         """API server host."""
         return os.getenv('API_HOST', '0.0.0.0')
 
-    @property
+    @cached_property
     def API_PORT(self) -> int:
         """API server port."""
         return int(os.getenv('API_PORT', '8000'))
 
-    @property
+    @cached_property
     def API_RELOAD(self) -> bool:
         """Enable auto-reload on code changes."""
         return os.getenv('API_RELOAD', 'true').lower() == 'true'
 
-    @property
+    @cached_property
     def LOG_LEVEL(self) -> str:
         """Logging level."""
         return os.getenv('LOG_LEVEL', 'info').lower()
@@ -86,7 +107,7 @@ class Config:
     # CORS CONFIGURATION
     # ========================================================================
 
-    @property
+    @cached_property
     def CORS_ORIGINS(self) -> List[str]:
         """List of allowed CORS origins."""
         origins_str = os.getenv('CORS_ORIGINS', '*')
@@ -98,12 +119,12 @@ class Config:
     # SESSION CONFIGURATION
     # ========================================================================
 
-    @property
+    @cached_property
     def SESSION_MAX_AGE(self) -> int:
         """Maximum session age in seconds."""
         return int(os.getenv('SESSION_MAX_AGE', '86400'))  # 24 hours
 
-    @property
+    @cached_property
     def SESSION_CLEANUP_INTERVAL(self) -> int:
         """Session cleanup interval in seconds."""
         return int(os.getenv('SESSION_CLEANUP_INTERVAL', '3600'))  # 1 hour
@@ -112,17 +133,17 @@ class Config:
     # PERFORMANCE CONFIGURATION
     # ========================================================================
 
-    @property
+    @cached_property
     def DB_POOL_SIZE(self) -> int:
         """Database connection pool size."""
         return int(os.getenv('DB_POOL_SIZE', '5'))
 
-    @property
+    @cached_property
     def DB_MAX_OVERFLOW(self) -> int:
         """Maximum overflow connections beyond pool size."""
         return int(os.getenv('DB_MAX_OVERFLOW', '10'))
 
-    @property
+    @cached_property
     def ENABLE_CACHING(self) -> bool:
         """Enable query result caching."""
         return os.getenv('ENABLE_CACHING', 'false').lower() == 'true'
@@ -131,17 +152,17 @@ class Config:
     # SECURITY CONFIGURATION
     # ========================================================================
 
-    @property
+    @cached_property
     def RATE_LIMIT(self) -> int:
         """Rate limit (requests per minute per session)."""
         return int(os.getenv('RATE_LIMIT', '100'))
 
-    @property
+    @cached_property
     def MAX_INPUT_LENGTH(self) -> int:
         """Maximum input string length for DPDA computation."""
         return int(os.getenv('MAX_INPUT_LENGTH', '10000'))
 
-    @property
+    @cached_property
     def MAX_COMPUTATION_STEPS(self) -> int:
         """Maximum computation steps."""
         return int(os.getenv('MAX_COMPUTATION_STEPS', '10000'))
@@ -191,3 +212,5 @@ def override_config(**kwargs):
     """
     for key, value in kwargs.items():
         os.environ[key] = str(value)
+        # Drop the cached value so the next access re-reads the environment
+        config.__dict__.pop(key, None)
@@ -40,48 +40,36 @@ class DPDAEngine:
         # Compute new configuration
         new_state = transition.to_state
 
-        # Handle input consumption
-        if transition.is_epsilon:
-            new_input = config.remaining_input
-        else:
+        # Handle input consumption. The input string is shared between
+        # configurations; consuming a symbol only moves the read position
+        new_input, new_pos = config.input_cursor
+        if not transition.is_epsilon:
             # Consume one input symbol
-            new_input = config.remaining_input[1:]
+            new_pos += 1
 
-        # Handle stack operations (now with list-based stack)
+        # Handle stack operations (now with list-based stack). The new stack
+        # is built as a fresh list below, so no copy is needed here
         if transition.stack_top is None:
             # Epsilon stack top means don't pop anything
-            remaining_stack = config.stack.copy()
+            remaining_stack = config.stack
         elif config.stack and config.stack[0] == transition.stack_top:
             # Pop the matching stack top
             remaining_stack = config.stack[1:]
         else:
             # This shouldn't happen if get_transition worked correctly
-            remaining_stack = config.stack.copy()
-
-        # Parse push symbols (may be multi-character symbols separated by commas)
-        # The transition.stack_push is a string that may contain comma-separated symbols
-        new_stack_symbols = []
-        if transition.stack_push:
-            # Check if it contains commas (multi-symbol push)
-            if ',' in transition.stack_push:
-                # Split by comma - each part is a symbol
-                for symbol in transition.stack_push.split(','):
-                    if symbol:  # Skip empty strings
-                        new_stack_symbols.append(symbol)
-            else:
-                # No commas - treat as single symbol (could be multi-char like "E1")
-                new_stack_symbols.append(transition.stack_push)
+            remaining_stack = config.stack
 
         # Create new stack: pushed symbols + remaining stack
-        new_stack = new_stack_symbols + remaining_stack
+        new_stack = [*transition.push_symbols, *remaining_stack]
 
-        return Configuration(new_state, new_input, new_stack)
+        return Configuration(new_state, new_input, new_stack, new_pos)
 
     def compute(
         self,
         dpda: DPDADefinition,
         input_string: str,
-        max_steps: int = 1000
+        max_steps: int = 1000,
+        keep_trace: bool = True
     ) -> ComputationResult:
         """
         Run the DPDA on an input string.
@@ -90,6 +78,8 @@ class DPDAEngine:
             dpda: The DPDA definition
             input_string: Input string to process
             max_steps: Maximum steps before timeout
+            keep_trace: Record every configuration. If False, only the
+                        final configuration is kept in the result's trace.
 
         Returns:
             ComputationResult with acceptance status and trace
@@ -101,57 +91,54 @@ class DPDAEngine:
             dpda.initial_stack_symbol
         )
 
-        trace = [config]
+        # Without keep_trace, intermediate configurations are never stored
+        trace = [config] if keep_trace else None
         steps = 0
+        # Bound once so the loop does local lookups instead of attribute lookups
+        accept_states = dpda.accept_states
+        step = self.step
+        trace_append = trace.append if keep_trace else None
 
         # Run computation
         while steps < max_steps:
-            # Check if we can take an epsilon transition to accept
-            if (config.remaining_input == '' and
-                config.state in dpda.accept_states):
+            # Accept as soon as the input is consumed in an accept state. This
+            # is the only accept check: if it fails, it fails for the same
+            # configuration when no transition applies below
+            if not config.has_input and config.state in accept_states:
                 return ComputationResult(
                     accepted=True,
                     final_state=config.state,
-                    trace=trace,
+                    trace=trace if keep_trace else [config],
                     steps_taken=steps
                 )
 
             # Try to take a step
-            next_config = self.step(dpda, config)
+            next_config = step(dpda, config)
 
             if next_config is None:
-                # No valid transition - check if we're in accept state
-                if (config.remaining_input == '' and
-                    config.state in dpda.accept_states):
-                    return ComputationResult(
-                        accepted=True,
-                        final_state=config.state,
-                        trace=trace,
-                        steps_taken=steps
-                    )
-                else:
-                    # Stuck with no valid transition
-                    rejection_reason = "No valid transition"
-                    if config.remaining_input:
-                        rejection_reason = "Input not fully consumed"
-                    return ComputationResult(
-                        accepted=False,
-                        final_state=config.state,
-                        trace=trace,
-                        steps_taken=steps,
-                        rejection_reason=rejection_reason
-                    )
+                # Stuck with no valid transition
+                rejection_reason = "No valid transition"
+                if config.has_input:
+                    rejection_reason = "Input not fully consumed"
+                return ComputationResult(
+                    accepted=False,
+                    final_state=config.state,
+                    trace=trace if keep_trace else [config],
+                    steps_taken=steps,
+                    rejection_reason=rejection_reason
+                )
 
             # Move to next configuration
             config = next_config
-            trace.append(config)
+            if trace_append is not None:
+                trace_append(config)
             steps += 1
 
         # Exceeded max steps
         return ComputationResult(
             accepted=False,
             final_state=config.state,
-            trace=trace,
+            trace=trace if keep_trace else [config],
             steps_taken=steps,
             rejection_reason="Maximum steps exceeded"
         )
\ No newline at end of file
@@ -3,15 +3,27 @@ DPDA Session Management module.
 Provides stateful session handling for building and managing multiple DPDAs.
 """
 
-import json
-from typing import Dict, Set, List, Optional, Any
+import sys
+from functools import lru_cache
+from typing import Dict, Set, List, Optional, Any, Iterable, Sequence, Tuple, Union
 from pathlib import Path
 from dataclasses import dataclass, field
 
+import orjson
+
 from models.dpda_definition import DPDADefinition
 from models.transition import Transition
 from validation.dpda_validator import DPDAValidator, ValidationResult
-from serialization.dpda_serializer import DPDASerializer
+
+
+def _intern_set(symbols: Iterable[str]) -> Set[str]:
+    """Return a new set holding interned copies of the given strings."""
+    return {sys.intern(s) for s in symbols}
+
+
+def _intern_optional(value: Optional[str]) -> Optional[str]:
+    """Intern a string, passing None (epsilon or unset) through."""
+    return sys.intern(value) if value is not None else None
 
 
 class SessionError(Exception):
@@ -19,7 +31,7 @@ class SessionError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class DPDABuilder:
     """Builder class for incrementally constructing a DPDA."""
     states: Set[str] = field(default_factory=set)
@@ -55,12 +67,12 @@ class DPDABuilder:
     def to_dict(self) -> Dict[str, Any]:
         """Convert builder to dictionary for serialization."""
         return {
-            'states': sorted(list(self.states)),
-            'input_alphabet': sorted(list(self.input_alphabet)),
-            'stack_alphabet': sorted(list(self.stack_alphabet)),
+            'states': sorted(self.states),
+            'input_alphabet': sorted(self.input_alphabet),
+            'stack_alphabet': sorted(self.stack_alphabet),
             'initial_state': self.initial_state,
             'initial_stack_symbol': self.initial_stack_symbol,
-            'accept_states': sorted(list(self.accept_states)),
+            'accept_states': sorted(self.accept_states),
             'transitions': [
                 {
                     'from_state': t.from_state,
@@ -73,24 +85,45 @@ class DPDABuilder:
             ]
         }
 
+    def snapshot_key(self) -> Tuple:
+        """
+        Return a hashable snapshot of the builder contents.
+
+        Two builders with the same contents produce equal keys, so the key
+        can be used to cache results derived from the builder (such as
+        validation) across requests.
+        """
+        return (
+            frozenset(self.states),
+            frozenset(self.input_alphabet),
+            frozenset(self.stack_alphabet),
+            self.initial_state,
+            self.initial_stack_symbol,
+            frozenset(self.accept_states),
+            tuple(
+                (t.from_state, t.input_symbol, t.stack_top, t.to_state, t.stack_push)
+                for t in self.transitions
+            )
+        )
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'DPDABuilder':
         """Create builder from dictionary."""
         builder = cls()
-        builder.states = set(data.get('states', []))
-        builder.input_alphabet = set(data.get('input_alphabet', []))
-        builder.stack_alphabet = set(data.get('stack_alphabet', []))
-        builder.initial_state = data.get('initial_state')
-        builder.initial_stack_symbol = data.get('initial_stack_symbol')
-        builder.accept_states = set(data.get('accept_states', []))
+        builder.states = _intern_set(data.get('states', []))
+        builder.input_alphabet = _intern_set(data.get('input_alphabet', []))
+        builder.stack_alphabet = _intern_set(data.get('stack_alphabet', []))
+        builder.initial_state = _intern_optional(data.get('initial_state'))
+        builder.initial_stack_symbol = _intern_optional(data.get('initial_stack_symbol'))
+        builder.accept_states = _intern_set(data.get('accept_states', []))
 
         # Recreate transitions
         for trans_dict in data.get('transitions', []):
             transition = Transition(
-                from_state=trans_dict['from_state'],
-                input_symbol=trans_dict['input_symbol'],
-                stack_top=trans_dict['stack_top'],
-                to_state=trans_dict['to_state'],
+                from_state=sys.intern(trans_dict['from_state']),
+                input_symbol=_intern_optional(trans_dict['input_symbol']),
+                stack_top=_intern_optional(trans_dict['stack_top']),
+                to_state=sys.intern(trans_dict['to_state']),
                 stack_push=trans_dict['stack_push']
             )
             builder.transitions.append(transition)
@@ -98,6 +131,42 @@ class DPDABuilder:
         return builder
 
 
+# The validator is stateless, so every session shares one instance
+_validator = DPDAValidator()
+
+
+def definition_from_snapshot(key: Tuple) -> DPDADefinition:
+    """
+    Build the DPDADefinition described by a DPDABuilder.snapshot_key().
+
+    Raises:
+        ValueError: If the definition is inconsistent
+    """
+    (states, input_alphabet, stack_alphabet, initial_state,
+     initial_stack_symbol, accept_states, transitions) = key
+    return DPDADefinition(
+        states=set(states),
+        input_alphabet=set(input_alphabet),
+        stack_alphabet=set(stack_alphabet),
+        initial_state=initial_state,
+        initial_stack_symbol=initial_stack_symbol,
+        accept_states=set(accept_states),
+        transitions=[Transition(*fields) for fields in transitions]
+    )
+
+
+@lru_cache(maxsize=1024)
+def _validate_snapshot(key: Tuple) -> ValidationResult:
+    """
+    Validate the DPDA described by a DPDABuilder.snapshot_key().
+
+    Results are memoized on the snapshot, so unchanged DPDAs are only
+    validated once. The returned ValidationResult is shared between
+    callers and must not be mutated.
+    """
+    return _validator.validate(definition_from_snapshot(key))
+
+
 class DPDASession:
     """
     Session manager for DPDA construction and management.
@@ -116,7 +185,6 @@ class DPDASession:
         self.dpdas: Dict[str, DPDABuilder] = {}
         self.current_dpda_name: Optional[str] = None
         self.is_modified = False
-        self._validator = DPDAValidator()
 
     @property
     def current_dpda(self) -> Optional[DPDABuilder]:
@@ -156,22 +224,22 @@ class DPDASession:
             raise SessionError("No current DPDA selected")
         return self.current_dpda
 
-    def set_states(self, states: Set[str]) -> None:
+    def set_states(self, states: Iterable[str]) -> None:
         """Set states for current DPDA."""
         builder = self.get_current_builder()
-        builder.states = states.copy()
+        builder.states = _intern_set(states)
         self.is_modified = True
 
-    def set_input_alphabet(self, alphabet: Set[str]) -> None:
+    def set_input_alphabet(self, alphabet: Iterable[str]) -> None:
         """Set input alphabet for current DPDA."""
         builder = self.get_current_builder()
-        builder.input_alphabet = alphabet.copy()
+        builder.input_alphabet = _intern_set(alphabet)
         self.is_modified = True
 
-    def set_stack_alphabet(self, alphabet: Set[str]) -> None:
+    def set_stack_alphabet(self, alphabet: Iterable[str]) -> None:
         """Set stack alphabet for current DPDA."""
         builder = self.get_current_builder()
-        builder.stack_alphabet = alphabet.copy()
+        builder.stack_alphabet = _intern_set(alphabet)
         self.is_modified = True
 
     def set_initial_state(self, state: str) -> None:
@@ -184,7 +252,7 @@ class DPDASession:
         builder = self.get_current_builder()
         if state not in builder.states:
             raise SessionError(f"State '{state}' not in states")
-        builder.initial_state = state
+        builder.initial_state = sys.intern(state)
         self.is_modified = True
 
     def set_initial_stack_symbol(self, symbol: str) -> None:
@@ -197,10 +265,10 @@ class DPDASession:
         builder = self.get_current_builder()
         if symbol not in builder.stack_alphabet:
             raise SessionError(f"Symbol '{symbol}' not in stack alphabet")
-        builder.initial_stack_symbol = symbol
+        builder.initial_stack_symbol = sys.intern(symbol)
         self.is_modified = True
 
-    def set_accept_states(self, states: Set[str]) -> None:
+    def set_accept_states(self, states: Iterable[str]) -> None:
         """
         Set accept states for current DPDA.
 
@@ -208,14 +276,16 @@ class DPDASession:
             SessionError: If any state not in states
         """
         builder = self.get_current_builder()
-        invalid = states - builder.states
+        accept_states = _intern_set(states)
+        invalid = accept_states - builder.states
         if invalid:
             raise SessionError(f"States {invalid} not in states")
-        builder.accept_states = states.copy()
+        builder.accept_states = accept_states
         self.is_modified = True
 
     def add_transition(self, from_state: str, input_symbol: Optional[str],
-                      stack_top: Optional[str], to_state: str, stack_push: str) -> None:
+                      stack_top: Optional[str], to_state: str,
+                      stack_push: Union[str, Sequence[str]]) -> None:
         """
         Add a transition to current DPDA.
 
@@ -224,11 +294,15 @@ class DPDASession:
             input_symbol: Input symbol (None for epsilon)
             stack_top: Stack symbol to match (None for epsilon - no stack check)
             to_state: Target state
-            stack_push: Stack symbols to push
+            stack_push: Stack symbols to push, as a comma-separated string
+                        or a sequence of symbols
         """
         builder = self.get_current_builder()
-        transition = Transition(from_state, input_symbol, stack_top,
-                               to_state, stack_push)
+        # Interned names let transition-table lookups and set membership
+        # checks short-circuit on identity
+        transition = Transition(sys.intern(from_state), _intern_optional(input_symbol),
+                               _intern_optional(stack_top), sys.intern(to_state),
+                               stack_push)
         builder.transitions.append(transition)
         self.is_modified = True
 
@@ -289,9 +363,9 @@ class DPDASession:
 
         return changes
 
-    def update_states(self, states: Optional[Set[str]] = None,
+    def update_states(self, states: Optional[Iterable[str]] = None,
                      initial_state: Optional[str] = None,
-                     accept_states: Optional[Set[str]] = None) -> Dict[str, Any]:
+                     accept_states: Optional[Iterable[str]] = None) -> Dict[str, Any]:
         """
         Update states configuration partially.
 
@@ -311,7 +385,7 @@ class DPDASession:
 
         # Update states first if provided
         if states is not None:
-            builder.states = states.copy()
+            builder.states = _intern_set(states)
             changes["states"] = list(states)
             self.is_modified = True
 
@@ -319,23 +393,24 @@ class DPDASession:
         if initial_state is not None:
             if initial_state not in builder.states:
                 raise SessionError(f"Initial state '{initial_state}' not in states")
-            builder.initial_state = initial_state
+            builder.initial_state = sys.intern(initial_state)
             changes["initial_state"] = initial_state
             self.is_modified = True
 
         # Update accept states
         if accept_states is not None:
-            invalid = accept_states - builder.states
+            new_accept_states = _intern_set(accept_states)
+            invalid = new_accept_states - builder.states
             if invalid:
                 raise SessionError(f"Accept states {invalid} not in states")
-            builder.accept_states = accept_states.copy()
+            builder.accept_states = new_accept_states
             changes["accept_states"] = list(accept_states)
             self.is_modified = True
 
         return changes
 
-    def update_alphabets(self, input_alphabet: Optional[Set[str]] = None,
-                        stack_alphabet: Optional[Set[str]] = None,
+    def update_alphabets(self, input_alphabet: Optional[Iterable[str]] = None,
+                        stack_alphabet: Optional[Iterable[str]] = None,
                         initial_stack_symbol: Optional[str] = None) -> Dict[str, Any]:
         """
         Update alphabets configuration partially.
@@ -356,17 +431,18 @@ class DPDASession:
 
         # Update input alphabet
         if input_alphabet is not None:
-            builder.input_alphabet = input_alphabet.copy()
+            builder.input_alphabet = _intern_set(input_alphabet)
             changes["input_alphabet"] = list(input_alphabet)
             self.is_modified = True
 
         # Update stack alphabet (validate with existing initial_stack_symbol if not also being updated)
         if stack_alphabet is not None:
             # Check if initial_stack_symbol would still be valid
+            new_stack_alphabet = _intern_set(stack_alphabet)
             check_symbol = initial_stack_symbol if initial_stack_symbol is not None else builder.initial_stack_symbol
-            if check_symbol and check_symbol not in stack_alphabet:
+            if check_symbol and check_symbol not in new_stack_alphabet:
                 raise SessionError(f"Initial stack symbol '{check_symbol}' must be in stack alphabet")
-            builder.stack_alphabet = stack_alphabet.copy()
+            builder.stack_alphabet = new_stack_alphabet
             changes["stack_alphabet"] = list(stack_alphabet)
             self.is_modified = True
 
@@ -374,7 +450,7 @@ class DPDASession:
         if initial_stack_symbol is not None:
             if initial_stack_symbol not in builder.stack_alphabet:
                 raise SessionError(f"Initial stack symbol '{initial_stack_symbol}' not in stack alphabet")
-            builder.initial_stack_symbol = initial_stack_symbol
+            builder.initial_stack_symbol = sys.intern(initial_stack_symbol)
             changes["initial_stack_symbol"] = initial_stack_symbol
             self.is_modified = True
 
@@ -384,7 +460,7 @@ class DPDASession:
                          input_symbol: Optional[str] = None,
                          stack_top: Optional[str] = None,
                          to_state: Optional[str] = None,
-                         stack_push: Optional[str] = None) -> Dict[str, Any]:
+                         stack_push: Optional[Union[str, Sequence[str]]] = None) -> Dict[str, Any]:
         """
         Update a specific transition by index.
 
@@ -394,7 +470,8 @@ class DPDASession:
             input_symbol: New input symbol (optional, None for epsilon)
             stack_top: New stack top symbol (optional, None for epsilon)
             to_state: New target state (optional)
-            stack_push: New stack push string (optional)
+            stack_push: New stack push symbols, as a comma-separated string or
+                        a sequence of symbols (optional)
 
         Returns:
             Dictionary of changes made
@@ -427,17 +504,20 @@ class DPDASession:
             changes["stack_top"] = stack_top
         if to_state is not None and to_state != transition.to_state:
             changes["to_state"] = to_state
-        if stack_push is not None and stack_push != transition.stack_push:
-            changes["stack_push"] = stack_push
 
         # Replace transition
-        builder.transitions[index] = Transition(
-            from_state=new_from_state,
-            input_symbol=new_input_symbol,
-            stack_top=new_stack_top,
-            to_state=new_to_state,
+        new_transition = Transition(
+            from_state=sys.intern(new_from_state),
+            input_symbol=_intern_optional(new_input_symbol),
+            stack_top=_intern_optional(new_stack_top),
+            to_state=sys.intern(new_to_state),
             stack_push=new_stack_push
         )
+        builder.transitions[index] = new_transition
+
+        # Compare parsed symbols so either stack_push form is detected alike
+        if stack_push is not None and new_transition.push_symbols != transition.push_symbols:
+            changes["stack_push"] = stack_push
 
         if changes:
             self.is_modified = True
@@ -455,8 +535,26 @@ class DPDASession:
             SessionError: If required fields are missing
         """
         builder = self.get_current_builder()
+        self._check_required_fields(builder)
 
-        # Validate required fields
+        return DPDADefinition(
+            states=builder.states.copy(),
+            input_alphabet=builder.input_alphabet.copy(),
+            stack_alphabet=builder.stack_alphabet.copy(),
+            initial_state=builder.initial_state,
+            initial_stack_symbol=builder.initial_stack_symbol,
+            accept_states=builder.accept_states.copy(),
+            transitions=builder.transitions.copy()
+        )
+
+    @staticmethod
+    def _check_required_fields(builder: DPDABuilder) -> None:
+        """
+        Ensure the builder has every field needed to build a DPDA.
+
+        Raises:
+            SessionError: If required fields are missing
+        """
         if not builder.states:
             raise SessionError("States not set")
         if builder.initial_state is None:
@@ -466,16 +564,64 @@ class DPDASession:
         if builder.initial_stack_symbol is None:
             raise SessionError("Initial stack symbol not set")
 
-        return DPDADefinition(
-            states=builder.states.copy(),
-            input_alphabet=builder.input_alphabet.copy(),
-            stack_alphabet=builder.stack_alphabet.copy(),
-            initial_state=builder.initial_state,
-            initial_stack_symbol=builder.initial_stack_symbol,
-            accept_states=builder.accept_states.copy(),
-            transitions=builder.transitions.copy()
+    def get_validation_cached(self) -> ValidationResult:
+        """
+        Validate the current DPDA, reusing earlier results for identical contents.
+
+        Returns:
+            ValidationResult for the current DPDA (shared, do not mutate)
+
+        Raises:
+            SessionError: If required fields are missing
+            ValueError: If the definition is inconsistent
+        """
+        return _validate_snapshot(self.current_snapshot_key())
+
+    def current_snapshot_key(self) -> Tuple:
+        """
+        Get the snapshot key of the current DPDA, for caching derived results.
+
+        Returns:
+            DPDABuilder.snapshot_key() of the current builder
+
+        Raises:
+            SessionError: If required fields are missing
+        """
+        builder = self.get_current_builder()
+        self._check_required_fields(builder)
+        return builder.snapshot_key()
+
+    def can_build(self) -> bool:
+        """
+        Check whether the current DPDA can be built, without raising.
+
+        Covers both the required-field checks of build_current_dpda and the
+        consistency checks of DPDADefinition.
+
+        Returns:
+            True if build_current_dpda would succeed
+        """
+        builder = self.get_current_builder()
+        return bool(
+            builder.states
+            and builder.initial_state in builder.states
+            and builder.initial_stack_symbol in builder.stack_alphabet
+            and builder.accept_states <= builder.states
         )
 
+    def try_build_and_validate(self) -> Tuple[bool, Optional[ValidationResult]]:
+        """
+        Validate the current DPDA if it can be built.
+
+        Returns:
+            Tuple of (is_valid, result); result is None and is_valid False
+            when the DPDA is incomplete or inconsistent
+        """
+        if not self.can_build():
+            return False, None
+        result = _validate_snapshot(self.get_current_builder().snapshot_key())
+        return result.is_valid, result
+
     def validate_current(self) -> ValidationResult:
         """
         Validate the current DPDA being built.
@@ -485,13 +631,10 @@ class DPDASession:
         """
         try:
             dpda = self.build_current_dpda()
-            return self._validator.validate(dpda)
+            return _validator.validate(dpda)
         except SessionError as e:
             # If can't build, return error
-            result = ValidationResult()
-            result.is_valid = False
-            result.errors.append(str(e))
-            return result
+            return ValidationResult(is_valid=False, errors=[str(e)])
 
     def switch_to(self, name: str) -> None:
         """
@@ -598,7 +741,7 @@ class DPDASession:
         }
 
         path = Path(filepath)
-        path.write_text(json.dumps(data, indent=2))
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         self.is_modified = False
 
     @classmethod
@@ -620,7 +763,7 @@ class DPDASession:
         if not path.exists():
             raise FileNotFoundError(f"Session file not found: {filepath}")
 
-        data = json.loads(path.read_text())
+        data = orjson.loads(path.read_bytes())
 
         # Validate version
         if 'version' not in data:
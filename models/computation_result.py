@@ -5,11 +5,17 @@ Represents the result of running a DPDA on an input string.
 
 from typing import List, Optional
 from models.configuration import Configuration
+from models.transition import Transition
 
 
 class ComputationResult:
     """Result of a DPDA computation."""
 
+    # Set by callers that already know the transitions taken between
+    # configurations; the engine leaves them unset and fills in trace only
+    configurations: Optional[List[Configuration]] = None
+    transitions: Optional[List[Transition]] = None
+
     def __init__(
         self,
         accepted: bool,
@@ -24,7 +30,8 @@ class ComputationResult:
         Args:
             accepted: Whether the input was accepted
             final_state: The final state reached
-            trace: List of configurations in the computation
+            trace: List of configurations in the computation (just the
+                   final configuration if the trace wasn't kept)
             steps_taken: Number of steps taken
             rejection_reason: Reason for rejection (if not accepted)
         """
@@ -34,6 +41,11 @@ class ComputationResult:
         self.steps_taken = steps_taken
         self.rejection_reason = rejection_reason
 
+    @property
+    def final_stack(self) -> List[str]:
+        """Stack contents of the final configuration (top first)."""
+        return self.trace[-1].stack if self.trace else []
+
     def __str__(self) -> str:
         """String representation."""
         status = "ACCEPTED" if self.accepted else "REJECTED"
@@ -3,24 +3,38 @@ Configuration model for DPDA.
 Represents an instantaneous description (ID) of the DPDA.
 """
 
-from typing import Optional, List, Union
+from typing import Optional, List, Tuple, Union
 
 
 class Configuration:
     """Represents a configuration (instantaneous description) of a DPDA."""
 
-    def __init__(self, state: str, remaining_input: str, stack: Union[str, List[str]]):
+    # Computations create one configuration per step, so skip the per-instance dict
+    __slots__ = ('state', '_input', '_pos', 'stack')
+
+    def __init__(
+        self,
+        state: str,
+        remaining_input: str,
+        stack: Union[str, List[str]],
+        input_pos: int = 0
+    ):
         """
         Initialize a configuration.
 
         Args:
             state: Current state
-            remaining_input: Remaining input string to process
+            remaining_input: Remaining input string to process, or the
+                             whole input when input_pos is given
             stack: Current stack contents (top is first element)
                    Can be string (for backward compat) or list of symbols
+            input_pos: Number of leading symbols of remaining_input already
+                       consumed. Lets successive configurations share one
+                       input string instead of slicing it at every step.
         """
         self.state = state
-        self.remaining_input = remaining_input
+        self._input = remaining_input
+        self._pos = input_pos
 
         # Convert string stack to list for uniform handling
         if isinstance(stack, str):
@@ -34,15 +48,25 @@ class Configuration:
         else:
             self.stack = stack if stack is not None else []
 
+    @property
+    def remaining_input(self) -> str:
+        """Remaining input string to process."""
+        return self._input[self._pos:] if self._pos else self._input
+
+    @property
+    def input_cursor(self) -> Tuple[str, int]:
+        """The shared input string and the read position within it."""
+        return self._input, self._pos
+
     @property
     def has_input(self) -> bool:
         """Check if there is remaining input."""
-        return len(self.remaining_input) > 0
+        return self._pos < len(self._input)
 
     @property
     def next_input_symbol(self) -> Optional[str]:
         """Get the next input symbol, or None if input is empty."""
-        return self.remaining_input[0] if self.remaining_input else None
+        return self._input[self._pos] if self._pos < len(self._input) else None
 
     @property
     def stack_top(self) -> Optional[str]:
@@ -87,28 +87,29 @@ class DPDADefinition:
         Returns:
             The matching transition, or None if no transition exists
         """
+        # Each probe is a single dict lookup; stored values are never None
+        table = self._transition_table
+
         # First try exact match
-        key = (state, input_symbol, stack_top)
-        if key in self._transition_table:
-            return self._transition_table[key]
+        transition = table.get((state, input_symbol, stack_top))
+        if transition is not None:
+            return transition
 
         # Try with epsilon stack (matches any stack top)
-        eps_stack_key = (state, input_symbol, None)
-        if eps_stack_key in self._transition_table:
-            return self._transition_table[eps_stack_key]
+        transition = table.get((state, input_symbol, None))
+        if transition is not None:
+            return transition
 
         # If no input transition found and input_symbol is not None,
         # try epsilon input transitions
         if input_symbol is not None:
             # Try epsilon input with exact stack match
-            epsilon_key = (state, None, stack_top)
-            if epsilon_key in self._transition_table:
-                return self._transition_table[epsilon_key]
+            transition = table.get((state, None, stack_top))
+            if transition is not None:
+                return transition
 
             # Try epsilon input with epsilon stack (matches any)
-            eps_both_key = (state, None, None)
-            if eps_both_key in self._transition_table:
-                return self._transition_table[eps_both_key]
+            return table.get((state, None, None))
 
         return None
 
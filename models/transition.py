@@ -3,19 +3,22 @@ Transition model for DPDA.
 Represents a single transition in the DPDA transition function.
 """
 
-from typing import Optional
+from typing import Optional, Sequence, Union
 
 
 class Transition:
     """Represents a transition in a DPDA."""
 
+    # Every DPDA and trace holds many transitions, so skip the per-instance dict
+    __slots__ = ('from_state', 'input_symbol', 'stack_top', 'to_state', 'stack_push', 'push_symbols')
+
     def __init__(
         self,
         from_state: str,
         input_symbol: Optional[str],
         stack_top: Optional[str],
         to_state: str,
-        stack_push: str
+        stack_push: Union[str, Sequence[str], None]
     ):
         """
         Initialize a transition.
@@ -25,13 +28,36 @@ class Transition:
             input_symbol: Input symbol to read (None for epsilon)
             stack_top: Symbol that must be on top of stack (None for epsilon - no stack check)
             to_state: Destination state
-            stack_push: String to push onto stack (empty string means pop)
+            stack_push: Symbols to push onto stack, either as a comma-separated
+                        string or a sequence of symbols (empty or None means pop)
+
+        Raises:
+            ValueError: If a sequence contains an empty symbol or one with a ','
         """
         self.from_state = from_state
         self.input_symbol = input_symbol
         self.stack_top = stack_top
         self.to_state = to_state
-        self.stack_push = stack_push
+
+        # Keep the comma-separated form for serialization and display, and
+        # the parsed symbols (top first) for the computation engine. Both
+        # input forms are normalised to the same pair, so equal pushes get
+        # equal stack_push strings whichever form they arrived in.
+        if stack_push is None:
+            self.push_symbols = ()
+        elif isinstance(stack_push, str):
+            # Empty pieces (as in "A,,B" or a trailing comma) are dropped;
+            # a single symbol may be multi-char like "E1"
+            self.push_symbols = tuple(s for s in stack_push.split(',') if s)
+        else:
+            self.push_symbols = tuple(stack_push)
+            for symbol in self.push_symbols:
+                if not symbol or ',' in symbol:
+                    raise ValueError(
+                        f"Invalid stack push symbol {symbol!r}: "
+                        "symbols must be non-empty and contain no ','"
+                    )
+        self.stack_push = ','.join(self.push_symbols)
 
     @property
     def is_epsilon(self) -> bool:
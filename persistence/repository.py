@@ -1,7 +1,7 @@
 """Repository pattern for DPDA persistence operations."""
 
 import json
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timezone
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
@@ -78,6 +78,20 @@ class DPDARepository:
         Returns:
             DPDABuilder instance if found, None otherwise
         """
+        result = self.get_dpda_with_name(dpda_id, session_id)
+        return result[0] if result is not None else None
+
+    def get_dpda_with_name(self, dpda_id: str, session_id: str) -> Optional[Tuple[DPDABuilder, str]]:
+        """
+        Retrieve a DPDA and its name by ID and session, from a single record.
+
+        Args:
+            dpda_id: DPDA identifier
+            session_id: Session identifier
+
+        Returns:
+            Tuple of (DPDABuilder, name) if found, None otherwise
+        """
         record = self.db.query(DPDARecord).filter_by(
             id=dpda_id,
             session_id=session_id
@@ -86,12 +100,16 @@ class DPDARepository:
         if record is None:
             return None
 
+        # Read the columns before the timestamp commit expires the record,
+        # which would otherwise reload it on the next attribute access
+        name = record.name
+        builder_dict = json.loads(record.builder_json)
+
         # Update last accessed timestamp
         self.update_last_accessed(dpda_id, session_id)
 
         # Deserialize and return builder
-        builder_dict = json.loads(record.builder_json)
-        return DPDABuilder.from_dict(builder_dict)
+        return DPDABuilder.from_dict(builder_dict), name
 
     def list_dpdas(self, session_id: str) -> List[Dict[str, Any]]:
         """
@@ -117,6 +135,36 @@ class DPDARepository:
             for record in records
         ]
 
+    def list_dpdas_with_builders(self, session_id: str) -> List[Tuple[Dict[str, Any], DPDABuilder]]:
+        """
+        List all DPDAs for a given session together with their builders.
+
+        Fetches metadata and builder JSON in one query, avoiding a separate
+        get_dpda() round trip per DPDA.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            List of (metadata dictionary, DPDABuilder) tuples
+        """
+        records = self.db.query(DPDARecord).filter_by(
+            session_id=session_id
+        ).order_by(DPDARecord.created_at.asc()).all()
+
+        return [
+            (
+                {
+                    'id': record.id,
+                    'name': record.name,
+                    'created_at': record.created_at,
+                    'last_accessed_at': record.last_accessed_at
+                },
+                DPDABuilder.from_dict(json.loads(record.builder_json))
+            )
+            for record in records
+        ]
+
     def update_dpda(self, dpda_id: str, session_id: str, builder: DPDABuilder) -> bool:
         """
         Update an existing DPDA.
@@ -155,17 +203,14 @@ class DPDARepository:
         Returns:
             True if deleted successfully, False if not found
         """
-        record = self.db.query(DPDARecord).filter_by(
+        # Single DELETE statement; the affected row count tells us whether
+        # the DPDA existed, so no preceding SELECT is needed
+        deleted = self.db.query(DPDARecord).filter_by(
             id=dpda_id,
             session_id=session_id
-        ).first()
-
-        if record is None:
-            return False
-
-        self.db.delete(record)
+        ).delete(synchronize_session=False)
         self.db.commit()
-        return True
+        return deleted > 0
 
     def dpda_exists(self, dpda_id: str, session_id: str) -> bool:
         """
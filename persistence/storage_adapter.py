@@ -9,15 +9,17 @@ Backends:
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 from core.session import DPDABuilder
-from persistence.database import get_db
-from persistence.repository import DPDARepository
 
 
 class StorageBackend(ABC):
     """Abstract base class for storage backends."""
 
+    # Whether operations do blocking I/O and should run off the event loop
+    is_blocking: bool = False
+
     @abstractmethod
     def create_dpda(self, dpda_id: str, session_id: str, name: str, builder: DPDABuilder) -> str:
         """Create a new DPDA in storage."""
@@ -28,11 +30,40 @@ class StorageBackend(ABC):
         """Retrieve a DPDA from storage."""
         pass
 
+    def get_dpda_with_name(self, dpda_id: str, session_id: str) -> Optional[Tuple[DPDABuilder, str]]:
+        """
+        Retrieve a DPDA together with its name.
+
+        Backends should override this to fetch both in one lookup; the
+        default falls back to get_dpda() plus a list_dpdas() scan.
+        """
+        builder = self.get_dpda(dpda_id, session_id)
+        if builder is None:
+            return None
+        for info in self.list_dpdas(session_id):
+            if info['id'] == dpda_id:
+                return builder, info.get('name', f"dpda_{dpda_id}")
+        return builder, f"dpda_{dpda_id}"
+
     @abstractmethod
     def list_dpdas(self, session_id: str) -> List[Dict]:
         """List all DPDAs for a session."""
         pass
 
+    def list_dpdas_with_builders(self, session_id: str) -> List[Tuple[Dict, DPDABuilder]]:
+        """
+        List all DPDAs for a session together with their builders.
+
+        Backends should override this to fetch everything in one pass; the
+        default falls back to one get_dpda() call per listed DPDA.
+        """
+        result = []
+        for info in self.list_dpdas(session_id):
+            builder = self.get_dpda(info['id'], session_id)
+            if builder is not None:
+                result.append((info, builder))
+        return result
+
     @abstractmethod
     def update_dpda(self, dpda_id: str, session_id: str, builder: DPDABuilder) -> bool:
         """Update an existing DPDA."""
@@ -50,12 +81,29 @@ class StorageBackend(ABC):
 
 
 class MemoryStorage(StorageBackend):
-    """In-memory storage implementation (not persistent across restarts)."""
+    """
+    In-memory storage implementation (not persistent across restarts).
 
-    def __init__(self):
-        """Initialize in-memory storage."""
+    Holds at most ``max_entries`` DPDAs; once full, creating a new DPDA
+    evicts the least recently used one.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        """
+        Initialize in-memory storage.
+
+        Args:
+            max_entries: Maximum number of stored DPDAs.
+                        If None, reads from config.MEMORY_MAX_DPDAS.
+        """
+        if max_entries is None:
+            # Import here to avoid circular dependency
+            from config import config
+            max_entries = config.MEMORY_MAX_DPDAS
+        self.max_entries = max_entries
         # Storage format: {"{session_id}:{dpda_id}": {"name": str, "builder": DPDABuilder}}
-        self._storage: Dict[str, Dict] = {}
+        # Ordered from least to most recently used
+        self._storage: "OrderedDict[str, Dict]" = OrderedDict()
 
     def _make_key(self, dpda_id: str, session_id: str) -> str:
         """Create storage key from session and DPDA ID."""
@@ -64,6 +112,8 @@ class MemoryStorage(StorageBackend):
     def create_dpda(self, dpda_id: str, session_id: str, name: str, builder: DPDABuilder) -> str:
         """Create a new DPDA in memory."""
         key = self._make_key(dpda_id, session_id)
+        if key not in self._storage and len(self._storage) >= self.max_entries:
+            self._storage.popitem(last=False)
         self._storage[key] = {
             "id": dpda_id,
             "session_id": session_id,
@@ -75,9 +125,20 @@ class MemoryStorage(StorageBackend):
     def get_dpda(self, dpda_id: str, session_id: str) -> Optional[DPDABuilder]:
         """Retrieve a DPDA from memory."""
         key = self._make_key(dpda_id, session_id)
-        if key in self._storage:
-            return self._storage[key]["builder"].copy()  # Return a copy to avoid mutations
-        return None
+        entry = self._storage.get(key)
+        if entry is None:
+            return None
+        self._storage.move_to_end(key)
+        return entry["builder"].copy()  # Return a copy to avoid mutations
+
+    def get_dpda_with_name(self, dpda_id: str, session_id: str) -> Optional[Tuple[DPDABuilder, str]]:
+        """Retrieve a DPDA and its name from memory in one lookup."""
+        key = self._make_key(dpda_id, session_id)
+        entry = self._storage.get(key)
+        if entry is None:
+            return None
+        self._storage.move_to_end(key)
+        return entry["builder"].copy(), entry["name"]
 
     def list_dpdas(self, session_id: str) -> List[Dict]:
         """List all DPDAs for a session from memory."""
@@ -94,24 +155,38 @@ class MemoryStorage(StorageBackend):
 
         return result
 
+    def list_dpdas_with_builders(self, session_id: str) -> List[Tuple[Dict, DPDABuilder]]:
+        """List all DPDAs for a session with builder copies, in one pass over memory."""
+        session_prefix = f"{session_id}:"
+        result = []
+
+        for key, data in self._storage.items():
+            if key.startswith(session_prefix):
+                info = {
+                    "id": data["id"],
+                    "name": data["name"],
+                    "session_id": data["session_id"]
+                }
+                result.append((info, data["builder"].copy()))
+
+        return result
+
     def update_dpda(self, dpda_id: str, session_id: str, builder: DPDABuilder, name: str = None) -> bool:
         """Update an existing DPDA in memory."""
         key = self._make_key(dpda_id, session_id)
-        if key in self._storage:
-            self._storage[key]["builder"] = builder.copy()  # Store a copy
-            # Update name if provided
-            if name is not None:
-                self._storage[key]["name"] = name
-            return True
-        return False
+        entry = self._storage.get(key)
+        if entry is None:
+            return False
+        self._storage.move_to_end(key)
+        entry["builder"] = builder.copy()  # Store a copy
+        # Update name if provided
+        if name is not None:
+            entry["name"] = name
+        return True
 
     def delete_dpda(self, dpda_id: str, session_id: str) -> bool:
         """Delete a DPDA from memory."""
-        key = self._make_key(dpda_id, session_id)
-        if key in self._storage:
-            del self._storage[key]
-            return True
-        return False
+        return self._storage.pop(self._make_key(dpda_id, session_id), None) is not None
 
     def exists(self, dpda_id: str, session_id: str) -> bool:
         """Check if a DPDA exists in memory."""
@@ -122,43 +197,68 @@ class MemoryStorage(StorageBackend):
 class DatabaseStorage(StorageBackend):
     """Database-backed storage implementation (persistent across restarts)."""
 
+    is_blocking = True
+
     def __init__(self):
         """Initialize database storage."""
+        # Imported here so memory-backed processes never load SQLAlchemy or
+        # create the engine
+        from persistence.database import get_db
+        from persistence.repository import DPDARepository
+        self._get_db = get_db
         # Repository is created per-operation to ensure proper session management
-        pass
+        self._repository_class = DPDARepository
 
     def create_dpda(self, dpda_id: str, session_id: str, name: str, builder: DPDABuilder) -> str:
         """Create a new DPDA in database."""
-        db = next(get_db())
+        db = next(self._get_db())
         try:
-            repo = DPDARepository(db)
+            repo = self._repository_class(db)
             return repo.create_dpda(dpda_id, session_id, name, builder)
         finally:
             db.close()
 
     def get_dpda(self, dpda_id: str, session_id: str) -> Optional[DPDABuilder]:
         """Retrieve a DPDA from database."""
-        db = next(get_db())
+        db = next(self._get_db())
         try:
-            repo = DPDARepository(db)
+            repo = self._repository_class(db)
             return repo.get_dpda(dpda_id, session_id)
         finally:
             db.close()
 
+    def get_dpda_with_name(self, dpda_id: str, session_id: str) -> Optional[Tuple[DPDABuilder, str]]:
+        """Retrieve a DPDA and its name from a single database record."""
+        db = next(self._get_db())
+        try:
+            repo = self._repository_class(db)
+            return repo.get_dpda_with_name(dpda_id, session_id)
+        finally:
+            db.close()
+
     def list_dpdas(self, session_id: str) -> List[Dict]:
         """List all DPDAs for a session from database."""
-        db = next(get_db())
+        db = next(self._get_db())
         try:
-            repo = DPDARepository(db)
+            repo = self._repository_class(db)
             return repo.list_dpdas(session_id)
         finally:
             db.close()
 
+    def list_dpdas_with_builders(self, session_id: str) -> List[Tuple[Dict, DPDABuilder]]:
+        """List all DPDAs for a session with their builders, in a single query."""
+        db = next(self._get_db())
+        try:
+            repo = self._repository_class(db)
+            return repo.list_dpdas_with_builders(session_id)
+        finally:
+            db.close()
+
     def update_dpda(self, dpda_id: str, session_id: str, builder: DPDABuilder, name: str = None) -> bool:
         """Update an existing DPDA in database."""
-        db = next(get_db())
+        db = next(self._get_db())
         try:
-            repo = DPDARepository(db)
+            repo = self._repository_class(db)
             success = repo.update_dpda(dpda_id, session_id, builder)
             # If name is provided, also update the record name
             if success and name is not None:
@@ -169,18 +269,18 @@ class DatabaseStorage(StorageBackend):
 
     def delete_dpda(self, dpda_id: str, session_id: str) -> bool:
         """Delete a DPDA from database."""
-        db = next(get_db())
+        db = next(self._get_db())
         try:
-            repo = DPDARepository(db)
+            repo = self._repository_class(db)
             return repo.delete_dpda(dpda_id, session_id)
         finally:
             db.close()
 
     def exists(self, dpda_id: str, session_id: str) -> bool:
         """Check if a DPDA exists in database."""
-        db = next(get_db())
+        db = next(self._get_db())
         try:
-            repo = DPDARepository(db)
+            repo = self._repository_class(db)
             return repo.dpda_exists(dpda_id, session_id)
         finally:
             db.close()
@@ -32,7 +32,7 @@ class DPDA:
         while (self.Q == -1):
             try:
                 self.Q = int(input("Enter number of states :\n"))
-            except:
+            except ValueError:
                 print("Invalid input: number of states must be int")
 
         # Get input alphabet
@@ -63,7 +63,7 @@ class DPDA:
                         .format(m, 0, self.Q - 1))
                     continue
                 self.F = i
-            except:
+            except ValueError:
                 print("Invalid input: accept state must be integers")
         return
 
@@ -167,7 +167,7 @@ class DPDA:
                     r = int(input("State to transition to : "))
                     if (r not in range(self.Q)):
                         print("Invalid input: input greater than", self.Q)
-            except:
+            except ValueError:
                 print("Invalid input: state must be integer")
 
         # Get stack symbol(s) to push w
@@ -60,6 +60,41 @@ class TestAPIEndpoints:
         response = client.get("/api/dpda/invalid_id", headers=auth_headers)
         assert response.status_code == 404
 
+    def test_get_dpda_info_etag(self, client, auth_headers, sample_dpda_id):
+        """Test conditional GET with ETag / If-None-Match."""
+        response = client.get(f"/api/dpda/{sample_dpda_id}", headers=auth_headers)
+        etag = response.headers["etag"]
+
+        # Unchanged DPDA: 304 with no body
+        response = client.get(f"/api/dpda/{sample_dpda_id}", headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+        # Any edit changes the ETag
+        client.post(f"/api/dpda/{sample_dpda_id}/states", json={
+            "states": ["q0"],
+            "initial_state": "q0",
+            "accept_states": []
+        }, headers=auth_headers)
+        response = client.get(f"/api/dpda/{sample_dpda_id}", headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_etag_is_stable_digest(self):
+        """Test that ETags depend only on DPDA contents, not set order or process."""
+        from api.endpoints import _snapshot_etag
+        from core.session import DPDABuilder
+
+        first = DPDABuilder()
+        first.states = {'q0', 'q1', 'q2'}
+        second = DPDABuilder()
+        second.states = {'q2', 'q1', 'q0'}
+
+        etag = _snapshot_etag(first.snapshot_key(), 'dpda-1')
+        assert etag == _snapshot_etag(second.snapshot_key(), 'dpda-1')
+        assert etag != _snapshot_etag(first.snapshot_key(), 'dpda-2')
+        assert len(etag) == 34
+
     def test_set_states_endpoint(self, client, auth_headers, sample_dpda_id):
         """Test setting DPDA states."""
         # Valid states configuration
@@ -248,6 +283,19 @@ class TestAPIEndpoints:
         assert data["trace"] is not None
         assert len(data["trace"]) > 0
 
+        # Test streamed trace
+        response = client.post(
+            f"/api/dpda/{sample_dpda_id}/compute?stream=true",
+            json={"input_string": "0011", "show_trace": True}
+        , headers=auth_headers)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert lines[0]["accepted"] is True
+        assert lines[0]["final_state"] == "q2"
+        assert len(lines) > 1
+        assert lines[-1]["state"] == "q2"
+
     def test_validate_endpoint(self, client, auth_headers, sample_dpda_id):
         """Test DPDA validation."""
         # Setup a valid DPDA
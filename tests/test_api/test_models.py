@@ -112,6 +112,11 @@ class TestAPIModels:
         assert request.input_symbol is None
         assert request.stack_push == []
 
+        # Push symbols must survive the comma-separated stack_push form
+        for bad_push in (["0", ""], ["0,$"]):
+            with pytest.raises(ValueError):
+                AddTransitionRequest(**{**data, "stack_push": bad_push})
+
     def test_compute_request(self):
         """Test ComputeRequest model."""
         from api.models import ComputeRequest
@@ -186,7 +191,7 @@ class TestAPIModels:
             message="DPDA violates determinism properties"
         )
         assert response.is_valid is False
-        assert response.violations[0]["type"] == "PROPERTY_A"
+        assert response.violations[0].type == "PROPERTY_A"
 
     def test_dpda_info_response(self):
         """Test DPDAInfoResponse model."""
@@ -371,7 +376,8 @@ class TestAPIModels:
         )
         assert response.id == "dpda_123"
         assert response.updated is True
-        assert "name" in response.changes
+        assert response.changes.name == "new_name"
+        assert response.changes.description is None
 
     def test_update_states_request(self):
         """Test UpdateStatesRequest model."""
@@ -465,4 +471,12 @@ class TestAPIModels:
 
         # Partial update of stack push
         request = UpdateTransitionRequest(stack_push=["X"])
-        assert request.stack_push == ["X"]
\ No newline at end of file
+        assert request.stack_push == ["X"]
+
+        # Empty or comma-containing push symbols are rejected
+        with pytest.raises(ValueError):
+            UpdateTransitionRequest(stack_push=["X,Y"])
+
+        # Empty update is rejected
+        with pytest.raises(ValueError):
+            UpdateTransitionRequest()
\ No newline at end of file
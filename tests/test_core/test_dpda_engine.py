@@ -59,6 +59,11 @@ class TestDPDAEngine:
         assert next_config.remaining_input == '011'
         assert next_config.stack == ['X', 'Z']  # Stack is now a list
 
+        # The input string is shared; only the read position advances
+        assert next_config.input_cursor == ('0011', 1)
+        assert next_config.next_input_symbol == '0'
+        assert next_config == Configuration('q0', '011', ['X', 'Z'])
+
     def test_epsilon_transition(self):
         """Test epsilon transitions (None input)."""
         # Configuration ready for epsilon transition
@@ -154,6 +159,16 @@ class TestDPDAEngine:
         last = result.trace[-1]
         assert last.remaining_input == ''  # All input consumed
 
+    def test_compute_without_trace(self):
+        """Test that keep_trace=False keeps only the final configuration."""
+        full = self.engine.compute(self.dpda, '01')
+        result = self.engine.compute(self.dpda, '01', keep_trace=False)
+
+        assert result.accepted == full.accepted
+        assert result.steps_taken == full.steps_taken
+        assert len(result.trace) == 1
+        assert result.final_stack == full.final_stack == full.trace[-1].stack
+
     def test_max_steps_limit(self):
         """Test that computation has a maximum step limit to prevent infinite loops."""
         # Create a DPDA with potential infinite loop
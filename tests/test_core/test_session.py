@@ -10,7 +10,7 @@ from pathlib import Path
 from typing import Set
 
 # These imports will fail initially (TDD Red phase)
-from core.session import DPDASession, SessionError
+from core.session import DPDASession, SessionError, definition_from_snapshot
 from models.dpda_definition import DPDADefinition
 from models.transition import Transition
 from validation.dpda_validator import DPDAValidator
@@ -189,6 +189,112 @@ class TestDPDASession:
         assert validation_result.is_valid == False
         assert len(validation_result.errors) > 0
 
+    def test_validation_cached_across_sessions(self):
+        """Test that identical builder contents reuse the cached validation result."""
+        def build_session():
+            session = DPDASession("test")
+            session.new_dpda("dpda1")
+            session.set_states({'q0', 'q1'})
+            session.set_input_alphabet({'a'})
+            session.set_stack_alphabet({'Z'})
+            session.set_initial_state('q0')
+            session.set_initial_stack_symbol('Z')
+            session.add_transition('q0', 'a', 'Z', 'q1', 'Z')
+            return session
+
+        session1 = build_session()
+        session2 = build_session()
+
+        result1 = session1.get_validation_cached()
+        assert result1.is_valid
+        assert session2.get_validation_cached() is result1
+
+        # Changing the builder invalidates the cached result
+        session2.add_transition('q0', 'a', 'Z', 'q0', 'Z')
+        result2 = session2.get_validation_cached()
+        assert result2 is not result1
+        assert not result2.is_valid
+
+        # Incomplete builders still raise
+        session3 = DPDASession("test")
+        session3.new_dpda("empty")
+        with pytest.raises(SessionError):
+            session3.get_validation_cached()
+
+    def test_try_build_and_validate(self):
+        """Test validity probing without exceptions for incomplete DPDAs."""
+        session = DPDASession("test")
+        session.new_dpda("dpda1")
+
+        assert session.can_build() is False
+        assert session.try_build_and_validate() == (False, None)
+
+        session.set_states({'q0', 'q1'})
+        session.set_input_alphabet({'a'})
+        session.set_stack_alphabet({'Z'})
+        session.set_initial_state('q0')
+        session.set_initial_stack_symbol('Z')
+        session.add_transition('q0', 'a', 'Z', 'q1', 'Z')
+
+        assert session.can_build() is True
+        is_valid, result = session.try_build_and_validate()
+        assert is_valid is True
+        assert result.is_valid
+
+        # Initial state no longer among the states
+        session.set_states({'q1'})
+        assert session.can_build() is False
+        assert session.try_build_and_validate() == (False, None)
+
+    def test_current_snapshot_key(self):
+        """Test that the snapshot key requires a buildable DPDA and rebuilds it."""
+        session = DPDASession("test")
+        session.new_dpda("dpda1")
+        with pytest.raises(SessionError):
+            session.current_snapshot_key()
+
+        session.set_states({'q0'})
+        session.set_input_alphabet({'a'})
+        session.set_stack_alphabet({'Z'})
+        session.set_initial_state('q0')
+        session.set_initial_stack_symbol('Z')
+        session.add_transition('q0', 'a', 'Z', 'q0', 'Z')
+
+        dpda = definition_from_snapshot(session.current_snapshot_key())
+        assert dpda.states == {'q0'}
+        assert dpda.transitions == session.build_current_dpda().transitions
+
+    def test_update_transition_stack_push_sequence(self):
+        """Test updating stack_push with a symbol sequence instead of a string."""
+        session = DPDASession("test")
+        session.new_dpda("dpda1")
+        session.add_transition('q0', 'a', 'Z', 'q0', 'X,Z')
+
+        # Same symbols in sequence form is not a change
+        assert session.update_transition(0, stack_push=['X', 'Z']) == {}
+
+        changes = session.update_transition(0, stack_push=['X', 'X', 'Z'])
+        assert changes == {"stack_push": ['X', 'X', 'Z']}
+        transition = session.get_current_builder().transitions[0]
+        assert transition.stack_push == 'X,X,Z'
+        assert transition.push_symbols == ('X', 'X', 'Z')
+
+    def test_builder_names_are_interned(self):
+        """Test that states and transition names share one interned object."""
+        session = DPDASession("test")
+        session.new_dpda("dpda1")
+
+        # Build names at runtime so they are not compile-time constants
+        state = ''.join(['q', 'long_state'])
+        session.set_states({state})
+        session.add_transition(''.join(['q', 'long_state']), None, None,
+                               ''.join(['q', 'long_state']), '')
+
+        builder = session.get_current_builder()
+        stored_state = next(iter(builder.states))
+        assert builder.transitions[0].from_state is stored_state
+        assert builder.transitions[0].to_state is stored_state
+
     def test_multiple_dpdas(self):
         """Test managing multiple DPDAs in a session."""
         session = DPDASession("test")
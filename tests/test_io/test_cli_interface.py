@@ -265,6 +265,17 @@ class TestCLIInterface:
         assert any('[1,X->eps]' in call for call in calls)
         assert any('[eps,Z->Z]' in call for call in calls)
 
+    def test_display_transitions_explicit_order(self):
+        """Test that display follows the state order passed in."""
+        transitions = [Transition('0', '0', 'Z', '1', ''), Transition('1', '1', 'Z', '0', '')]
+
+        with patch('builtins.print') as mock_print:
+            self.cli.display_transitions(transitions, num_states=2, ordered_states=('1', '0'))
+
+        output = mock_print.call_args[0][0]
+        assert output.index('Transitions for state 1:') < output.index('Transitions for state 0:')
+        assert output.splitlines()[1] == '[1,Z->eps]'
+
     def test_epsilon_input_handling(self, monkeypatch):
         """Test that '-' is properly converted to None for epsilon."""
         # User enters '-' for epsilon in various contexts
@@ -309,4 +320,35 @@ class TestCLIInterface:
 
         # The CLI should detect and report the violation
         # (Implementation will handle this when we write it)
-        assert len(transitions) >= 1  # At least first transition added
\ No newline at end of file
+        assert len(transitions) >= 1  # At least first transition added
+
+    def test_determinism_violation_reports_earliest_conflict(self):
+        """Test that the indexed determinism check reports the first conflicting transition."""
+        bucket = {}
+        for trans in (Transition('0', None, 'Z', '0', ''), Transition('0', '0', None, '0', '')):
+            bucket[(trans.input_symbol, trans.stack_top)] = (len(bucket), trans)
+
+        # Conflicts with both; the epsilon-input transition was entered first
+        msg = self.cli._check_determinism_violation(Transition('0', '0', 'Z', '1', ''), bucket, '0')
+        assert msg == "Violation of DPDA: epsilon and non-epsilon transitions from same state 0 with same stack"
+
+        # Epsilon-stack transition conflicts with the existing specific-stack one
+        bucket = {('1', 'X'): (0, Transition('0', '1', 'X', '0', ''))}
+        msg = self.cli._check_determinism_violation(Transition('0', '1', None, '0', ''), bucket, '0')
+        assert msg.startswith("Violation of DPDA due to epsilon stack transition from state 0:")
+
+        assert self.cli._check_determinism_violation(Transition('0', '1', 'Z', '0', ''), bucket, '0') is None
+
+    def test_parse_symbol(self):
+        """Test parsing of epsilon, escaped and unknown symbols."""
+        alphabet = {'a'}
+        assert self.cli._parse_symbol('-', alphabet, add_unknown=False) == (None, True)
+        assert self.cli._parse_symbol('', alphabet, add_unknown=False) == (None, True)
+        assert self.cli._parse_symbol('a', alphabet, add_unknown=False) == ('a', True)
+        assert self.cli._parse_symbol('--', alphabet, add_unknown=False) == ('-', False)
+        assert self.cli._parse_symbol('b', alphabet, add_unknown=False) == ('b', False)
+        assert alphabet == {'a'}
+
+        assert self.cli._parse_symbol('--', alphabet, add_unknown=True) == ('-', True)
+        assert self.cli._parse_symbol('X', alphabet, add_unknown=True) == ('X', True)
+        assert alphabet == {'a', '-', 'X'}
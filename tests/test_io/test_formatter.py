@@ -177,4 +177,26 @@ class TestOutputFormatter:
 
         # Non-empty input
         assert self.formatter.format_input('abc') == 'abc'
-        assert self.formatter.format_input('0011') == '0011'
\ No newline at end of file
+        assert self.formatter.format_input('0011') == '0011'
+
+    def test_format_strings_are_cached(self):
+        """Test that state and transition strings are reused across calls."""
+        assert self.formatter.format_state('12') is OutputFormatter().format_state('12')
+        assert self.formatter.format_transition('a', None, '') is self.formatter.format_transition('a', None, '')
+        assert self.formatter.format_transition('a', None, '') == "[a,eps->eps]"
+
+    def test_format_stack_step(self):
+        """Test that stepping the stack string matches formatting from scratch."""
+        push = Transition('0', 'a', 'Z', '0', 'XX,Z')
+        prev = ['Z']
+        stack = ['XX', 'Z']
+        result = self.formatter.format_stack_step(prev, 'Z', stack, push)
+        assert result == self.formatter.format_stack(stack) == 'ZXX'
+
+        pop = Transition('0', 'b', 'XX', '0', '')
+        result = self.formatter.format_stack_step(stack, 'ZXX', ['Z'], pop)
+        assert result == 'Z'
+        assert self.formatter.format_stack_step(['Z'], 'Z', [], Transition('0', 'b', 'Z', '0', '')) == 'eps'
+
+        # Stacks that don't match the transition are formatted from scratch
+        assert self.formatter.format_stack_step(['Z'], 'Z', ['Y', 'Z'], push) == 'ZY'
@@ -60,6 +60,52 @@ class TestTransition:
         assert trans.stack_push == ''
         assert trans.is_pop_operation is True
 
+    def test_push_symbols_from_string_and_sequence(self):
+        """Test that push symbols are parsed once from either input form."""
+        from_string = Transition('q0', 'a', 'Z', 'q1', 'X,Z')
+        from_list = Transition('q0', 'a', 'Z', 'q1', ['X', 'Z'])
+
+        assert from_string.push_symbols == ('X', 'Z')
+        assert from_list.push_symbols == ('X', 'Z')
+        assert from_list.stack_push == 'X,Z'
+        assert from_string == from_list
+
+        assert Transition('q0', 'a', 'Z', 'q1', 'E1').push_symbols == ('E1',)
+        assert Transition('q0', 'a', 'Z', 'q1', '').push_symbols == ()
+
+    def test_push_normalisation_round_trip(self):
+        """Test that both push forms normalise alike and survive a builder round trip."""
+        from core.session import DPDABuilder
+
+        from_string = Transition('q0', 'a', 'Z', 'q1', 'X,,Z,')
+        assert from_string.stack_push == 'X,Z'
+        assert from_string == Transition('q0', 'a', 'Z', 'q1', ['X', 'Z'])
+
+        for bad in (['X', ''], ['X,Y']):
+            with pytest.raises(ValueError):
+                Transition('q0', 'a', 'Z', 'q1', bad)
+
+        builder = DPDABuilder()
+        builder.transitions = [from_string, Transition('q1', None, 'Z', 'q1', ['E1', 'Z'])]
+        restored = DPDABuilder.from_dict(builder.to_dict())
+
+        assert restored.snapshot_key() == builder.snapshot_key()
+        assert [t.push_symbols for t in restored.transitions] == [('X', 'Z'), ('E1', 'Z')]
+
+    def test_stored_push_values_load_normalised(self):
+        """Test how previously stored stack_push values are read back."""
+        from core.session import DPDABuilder
+
+        stored = {'transitions': [
+            {'from_state': 'q0', 'input_symbol': 'a', 'stack_top': 'Z', 'to_state': 'q0', 'stack_push': push}
+            for push in (None, '', 'XZ', 'X,Z', 'X,,Z', ',X,')
+        ]}
+        builder = DPDABuilder.from_dict(stored)
+
+        # None still means pop; empty pieces between commas are dropped
+        assert [t['stack_push'] for t in builder.to_dict()['transitions']] == ['', '', 'XZ', 'X,Z', 'X,Z', 'X']
+        assert builder.transitions[0].is_pop_operation
+
 
 class TestConfiguration:
     """Test the Configuration model class."""
@@ -117,6 +163,11 @@ class TestConfiguration:
         assert '0011' in str_repr
         assert 'XZ' in str_repr
 
+    def test_configuration_uses_slots(self):
+        """Test that configurations carry no per-instance __dict__."""
+        config = Configuration('q0', '01', 'Z')
+        assert not hasattr(config, '__dict__')
+
 
 class TestDPDADefinition:
     """Test the DPDADefinition model class."""
@@ -42,6 +42,13 @@ class TestStorageBackendInterface:
         assert hasattr(storage, 'delete_dpda')
         assert hasattr(storage, 'exists')
 
+    def test_blocking_flags(self):
+        """Only the database backend is flagged as doing blocking I/O."""
+        from persistence.storage_adapter import MemoryStorage, DatabaseStorage
+
+        assert MemoryStorage.is_blocking is False
+        assert DatabaseStorage.is_blocking is True
+
 
 class TestMemoryStorage:
     """Test in-memory storage implementation."""
@@ -86,6 +93,16 @@ class TestMemoryStorage:
         assert isinstance(result, DPDABuilder)
         assert result.initial_state == 'q0'
 
+    def test_get_dpda_with_name_in_memory(self, storage, sample_builder):
+        """Should retrieve a DPDA and its name in one call."""
+        storage.create_dpda('test-dpda', 'session-123', 'Test', sample_builder)
+
+        builder, name = storage.get_dpda_with_name('test-dpda', 'session-123')
+
+        assert builder.initial_state == 'q0'
+        assert name == 'Test'
+        assert storage.get_dpda_with_name('nonexistent', 'session-123') is None
+
     def test_get_dpda_not_found_in_memory(self, storage):
         """Should return None for non-existent DPDA."""
         result = storage.get_dpda('nonexistent', 'session-123')
@@ -112,6 +129,20 @@ class TestMemoryStorage:
         assert 'dpda-2' in ids
         assert 'dpda-3' not in ids
 
+    def test_list_dpdas_with_builders_in_memory(self, storage, sample_builder):
+        """Should list a session's DPDAs together with their builders."""
+        storage.create_dpda('dpda-1', 'session-123', 'DPDA 1', sample_builder)
+        storage.create_dpda('dpda-2', 'session-456', 'DPDA 2', sample_builder)
+
+        entries = storage.list_dpdas_with_builders('session-123')
+
+        assert len(entries) == 1
+        info, builder = entries[0]
+        assert info['id'] == 'dpda-1'
+        assert info['name'] == 'DPDA 1'
+        assert isinstance(builder, DPDABuilder)
+        assert builder.initial_state == 'q0'
+
     def test_update_dpda_in_memory(self, storage, sample_builder):
         """Should update existing DPDA in memory."""
         storage.create_dpda('test-dpda', 'session-123', 'Original', sample_builder)
@@ -168,6 +199,22 @@ class TestMemoryStorage:
         # They should be different instances (can modify one without affecting other)
         assert dpda1 is not dpda2
 
+    def test_lru_eviction_in_memory(self, sample_builder):
+        """Memory storage should evict the least recently used DPDA when full."""
+        from persistence.storage_adapter import MemoryStorage
+
+        storage = MemoryStorage(max_entries=2)
+        storage.create_dpda('dpda1', 'session1', 'First', sample_builder)
+        storage.create_dpda('dpda2', 'session1', 'Second', sample_builder)
+
+        # Touch dpda1 so dpda2 becomes least recently used
+        assert storage.get_dpda('dpda1', 'session1') is not None
+        storage.create_dpda('dpda3', 'session1', 'Third', sample_builder)
+
+        assert storage.exists('dpda1', 'session1')
+        assert not storage.exists('dpda2', 'session1')
+        assert storage.exists('dpda3', 'session1')
+
 
 class TestDatabaseStorage:
     """Test database-backed storage implementation."""
@@ -223,6 +270,16 @@ class TestDatabaseStorage:
         assert isinstance(result, DPDABuilder)
         assert result.initial_state == 'q0'
 
+    def test_get_dpda_with_name_in_database(self, storage, sample_builder):
+        """Should retrieve a DPDA and its name in one call."""
+        storage.create_dpda('test-dpda', 'session-123', 'Test', sample_builder)
+
+        builder, name = storage.get_dpda_with_name('test-dpda', 'session-123')
+
+        assert builder.initial_state == 'q0'
+        assert name == 'Test'
+        assert storage.get_dpda_with_name('nonexistent', 'session-123') is None
+
     def test_get_dpda_not_found_in_database(self, storage):
         """Should return None for non-existent DPDA."""
         result = storage.get_dpda('nonexistent', 'session-123')
@@ -249,6 +306,20 @@ class TestDatabaseStorage:
         assert 'dpda-2' in ids
         assert 'dpda-3' not in ids
 
+    def test_list_dpdas_with_builders_in_database(self, storage, sample_builder):
+        """Should list a session's DPDAs together with their builders."""
+        storage.create_dpda('dpda-1', 'session-123', 'DPDA 1', sample_builder)
+        storage.create_dpda('dpda-2', 'session-456', 'DPDA 2', sample_builder)
+
+        entries = storage.list_dpdas_with_builders('session-123')
+
+        assert len(entries) == 1
+        info, builder = entries[0]
+        assert info['id'] == 'dpda-1'
+        assert info['name'] == 'DPDA 1'
+        assert isinstance(builder, DPDABuilder)
+        assert builder.initial_state == 'q0'
+
     def test_update_dpda_in_database(self, storage, sample_builder):
         """Should update existing DPDA in database."""
         storage.create_dpda('test-dpda', 'session-123', 'Original', sample_builder)
@@ -200,6 +200,7 @@ class TestDPDAValidator:
 
         assert result.is_valid is False
         assert any('stack symbol' in error.lower() for error in result.errors)
+        assert [v.kind for v in result.violations] == ['stack_symbol']
 
     def test_property_d_violation_push_symbols(self):
         """Test detection of invalid symbols in push operation."""
@@ -307,4 +308,28 @@ class TestDPDAValidator:
         # Error should mention the specific conflict
         assert any('q0' in error for error in result.errors)
         assert any('0' in error for error in result.errors)
-        assert any('Z' in error for error in result.errors)
\ No newline at end of file
+        assert any('Z' in error for error in result.errors)
+
+    def test_structured_violations(self):
+        """Test that violations carry their property type alongside the message."""
+        transitions = [
+            Transition('q0', '0', 'Z', 'q1', 'X,Z'),
+            Transition('q0', '0', 'Z', 'q2', 'Y,Z'),  # Property (a) violation
+            Transition('q0', None, 'Z', 'q1', 'Z'),   # Property (b) violation
+        ]
+
+        dpda = DPDADefinition(
+            states={'q0', 'q1', 'q2'},
+            input_alphabet={'0'},
+            stack_alphabet={'Z', 'X', 'Y'},
+            initial_state='q0',
+            initial_stack_symbol='Z',
+            accept_states={'q2'},
+            transitions=transitions
+        )
+
+        result = self.validator.validate(dpda)
+
+        types = {v.type for v in result.violations}
+        assert types == {"Property (a) violation", "Property (b) violation"}
+        assert [v.description for v in result.violations] == result.errors
@@ -4,16 +4,27 @@ Checks the four properties that must hold for a valid DPDA.
 """
 
 from typing import List, Set, Dict, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from models.dpda_definition import DPDADefinition
 from models.transition import Transition
 
 
+@dataclass
+class Violation:
+    """A single validation violation."""
+    type: str
+    description: str
+    # Finer-grained category within the type, e.g. 'stack_symbol' for a
+    # property (d) violation on a transition's stack top
+    kind: str = ''
+
+
 @dataclass
 class ValidationResult:
     """Result of DPDA validation."""
     is_valid: bool
-    errors: List[str]
+    errors: List[str] = field(default_factory=list)
+    violations: List[Violation] = field(default_factory=list)
 
 
 class DPDAValidator:
@@ -33,28 +44,30 @@ class DPDAValidator:
             dpda: The DPDA definition to validate
 
         Returns:
-            ValidationResult with validity status and error messages
+            ValidationResult with validity status, error messages and
+            the same errors as structured violations
         """
-        errors = []
+        violations = []
 
         # Property (d): Check all symbols and states are valid
-        errors.extend(self._check_property_d(dpda))
+        violations.extend(self._check_property_d(dpda))
 
         # Property (a): Check for determinism on (state, input, stack)
-        errors.extend(self._check_property_a(dpda))
+        violations.extend(self._check_property_a(dpda))
 
         # Property (b): Check no epsilon/non-epsilon conflicts
-        errors.extend(self._check_property_b(dpda))
+        violations.extend(self._check_property_b(dpda))
 
         # Property (c): Check epsilon transitions have disjoint stack requirements
-        errors.extend(self._check_property_c(dpda))
+        violations.extend(self._check_property_c(dpda))
 
         return ValidationResult(
-            is_valid=len(errors) == 0,
-            errors=errors
+            is_valid=len(violations) == 0,
+            errors=[v.description for v in violations],
+            violations=violations
         )
 
-    def _check_property_a(self, dpda: DPDADefinition) -> List[str]:
+    def _check_property_a(self, dpda: DPDADefinition) -> List[Violation]:
         """Check property (a): at most one transition per (state, input, stack)."""
         errors = []
         seen = {}
@@ -64,17 +77,18 @@ class DPDAValidator:
             if key in seen:
                 prev_trans = seen[key]
                 input_str = trans.input_symbol if trans.input_symbol else 'epsilon'
-                errors.append(
+                errors.append(Violation(
+                    "Property (a) violation",
                     f"Property (a) violation: Multiple transitions for "
                     f"({trans.from_state}, {input_str}, {trans.stack_top}). "
                     f"Found transitions to states {prev_trans.to_state} and {trans.to_state}"
-                )
+                ))
             else:
                 seen[key] = trans
 
         return errors
 
-    def _check_property_b(self, dpda: DPDADefinition) -> List[str]:
+    def _check_property_b(self, dpda: DPDADefinition) -> List[Violation]:
         """Check property (b): no epsilon and non-epsilon from same (state, stack)."""
         errors = []
 
@@ -92,14 +106,15 @@ class DPDAValidator:
             has_non_epsilon = any(not t.is_epsilon for t in transitions)
 
             if has_epsilon and has_non_epsilon:
-                errors.append(
+                errors.append(Violation(
+                    "Property (b) violation",
                     f"Property (b) violation: Both epsilon and non-epsilon transitions "
                     f"from state {state} with stack top {stack}"
-                )
+                ))
 
         return errors
 
-    def _check_property_c(self, dpda: DPDADefinition) -> List[str]:
+    def _check_property_c(self, dpda: DPDADefinition) -> List[Violation]:
         """Check property (c): multiple epsilon transitions have disjoint stack requirements."""
         errors = []
 
@@ -121,61 +136,74 @@ class DPDAValidator:
                     seen = set()
                     for stack_top in stack_tops:
                         if stack_top in seen:
-                            errors.append(
+                            errors.append(Violation(
+                                "Property (c) violation",
                                 f"Property (c) violation: Multiple epsilon transitions "
                                 f"from state {state} with same stack top {stack_top}"
-                            )
+                            ))
                             break
                         seen.add(stack_top)
 
         return errors
 
-    def _check_property_d(self, dpda: DPDADefinition) -> List[str]:
+    def _check_property_d(self, dpda: DPDADefinition) -> List[Violation]:
         """Check property (d): all symbols and states in transitions are valid."""
         errors = []
 
         for trans in dpda.transitions:
             # Check from_state
             if trans.from_state not in dpda.states:
-                errors.append(
-                    f"Property (d) violation: Transition from invalid state '{trans.from_state}'"
-                )
+                errors.append(Violation(
+                    "Property (d) violation",
+                    f"Property (d) violation: Transition from invalid state '{trans.from_state}'",
+                    'from_state'
+                ))
 
             # Check to_state
             if trans.to_state not in dpda.states:
-                errors.append(
-                    f"Property (d) violation: Transition to invalid state '{trans.to_state}'"
-                )
+                errors.append(Violation(
+                    "Property (d) violation",
+                    f"Property (d) violation: Transition to invalid state '{trans.to_state}'",
+                    'to_state'
+                ))
 
             # Check input symbol
             if trans.input_symbol is not None and trans.input_symbol not in dpda.input_alphabet:
-                errors.append(
-                    f"Property (d) violation: Transition uses invalid input symbol '{trans.input_symbol}'"
-                )
+                errors.append(Violation(
+                    "Property (d) violation",
+                    f"Property (d) violation: Transition uses invalid input symbol '{trans.input_symbol}'",
+                    'input_symbol'
+                ))
 
             # Check stack top (None is valid for epsilon transitions)
             if trans.stack_top is not None and trans.stack_top not in dpda.stack_alphabet:
-                errors.append(
-                    f"Property (d) violation: Transition uses invalid stack symbol '{trans.stack_top}'"
-                )
+                errors.append(Violation(
+                    "Property (d) violation",
+                    f"Property (d) violation: Transition uses invalid stack symbol '{trans.stack_top}'",
+                    'stack_symbol'
+                ))
 
             # Check stack push symbols
             # Handle multi-character symbols: if no comma, treat as single symbol
             if trans.stack_push:  # Only check if not empty string
                 if ',' in trans.stack_push:
-                    # Comma-separated symbols
-                    for symbol in trans.stack_push.split(','):
-                        if symbol and symbol not in dpda.stack_alphabet:
-                            errors.append(
+                    # Comma-separated symbols, already parsed by the transition
+                    for symbol in trans.push_symbols:
+                        if symbol not in dpda.stack_alphabet:
+                            errors.append(Violation(
+                                "Property (d) violation",
                                 f"Property (d) violation: Transition pushes invalid symbol '{symbol}' "
-                                f"in push string '{trans.stack_push}'"
-                            )
+                                f"in push string '{trans.stack_push}'",
+                                'push_symbol'
+                            ))
                 else:
                     # Single symbol (could be multi-character)
                     if trans.stack_push not in dpda.stack_alphabet:
-                        errors.append(
+                        errors.append(Violation(
+                            "Property (d) violation",
                             f"Property (d) violation: Transition pushes invalid symbol '{trans.stack_push}' "
-                            f"not in stack alphabet"
-                        )
+                            f"not in stack alphabet",
+                            'push_symbol'
+                        ))
 
         return errors
\ No newline at end of file